@@ -0,0 +1,72 @@
+"""
+Model Artifact Loading for Learning Pulse Module
+
+Shared loader and writer for the serialized model, scaler and other artifacts.
+Deserialized objects are cached per (path, modification time) so repeated
+component construction within a worker reuses one in-memory copy, while a
+re-trained artifact written to the same path is picked up automatically.
+
+Files with a .pkl suffix are plain pickles (protocol 5) and load without
+joblib's unpickler; anything else goes through joblib.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+import os
+import pickle
+
+import joblib
+
+# Suffixes stored as plain pickles rather than joblib files
+PICKLE_SUFFIXES = (".pkl", ".pickle")
+
+
+@lru_cache(maxsize=4)
+def _cached_load(path: str, mtime: float) -> object:
+    """Deserialize an artifact; mtime is part of the cache key only."""
+    if path.endswith(PICKLE_SUFFIXES):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    return joblib.load(path)
+
+
+def load_artifact(path: str) -> object:
+    """
+    Load a serialized artifact, reusing a cached copy when unchanged.
+
+    The returned object is shared between callers and must be treated as
+    read-only.
+
+    Args:
+        path: Path to the serialized artifact
+
+    Returns:
+        The deserialized object
+
+    Raises:
+        FileNotFoundError: If the artifact doesn't exist
+    """
+    path = os.path.abspath(path)
+    return _cached_load(path, os.path.getmtime(path))
+
+
+def save_artifact(obj: object, path: str) -> None:
+    """
+    Serialize an artifact in the format implied by its file suffix.
+
+    Both formats use the highest pickle protocol.
+
+    Args:
+        obj: Object to serialize (e.g. a fitted model or scaler)
+        path: Destination path; .pkl/.pickle writes a plain pickle, anything
+            else a joblib file
+    """
+    if str(path).endswith(PICKLE_SUFFIXES):
+        Path(path).write_bytes(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    else:
+        joblib.dump(obj, path, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def clear_artifact_cache() -> None:
+    """Drop all cached artifacts (e.g. after replacing model files in place)."""
+    _cached_load.cache_clear()
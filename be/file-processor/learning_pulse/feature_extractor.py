@@ -8,22 +8,142 @@ suitable for ML model input. Handles:
 - Activity feature extraction (Requirements 4.1-4.7)
 - Feature normalization (Requirements 9.1-9.5)
 - Missing value imputation (Requirements 9.2-9.4)
+- Vectorized batch extraction for bulk scoring
 """
 
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Optional, List, Tuple
 from pathlib import Path
 import logging
+import threading
 
-import joblib
+import numpy as np
 
+from .artifacts import load_artifact, save_artifact
 from .models import (
     BehaviorData,
     FeatureVector,
     EngagementTrend,
+    FEATURE_NAMES,
 )
 
 logger = logging.getLogger("learning_pulse.feature_extractor")
 
+# Per-category slices of FEATURE_NAMES, matching the tuples returned by
+# FeatureExtractor._compute_*_features
+CHAT_FEATURE_NAMES = FEATURE_NAMES[0:8]
+MATERIAL_FEATURE_NAMES = FEATURE_NAMES[8:15]
+ACTIVITY_FEATURE_NAMES = FEATURE_NAMES[15:22]
+QUIZ_FEATURE_NAMES = FEATURE_NAMES[22:25]
+
+# Encoding of engagement_trend_encoded: declining = 0, stable = 0.5, increasing = 1
+TREND_TO_CODE = {
+    EngagementTrend.DECLINING: 0.0,
+    EngagementTrend.STABLE: 0.5,
+    EngagementTrend.INCREASING: 1.0,
+}
+
+
+def behavior_row(data: BehaviorData) -> tuple:
+    """
+    Flatten the raw numeric inputs of one record in BehaviorBatch field order.
+    
+    Missing quiz data becomes zero attempts, which extracts to the same
+    defaults, so the tuple fully determines the feature vector.
+    """
+    chat, material, activity, quiz = data.chat, data.material, data.activity, data.quiz
+    return (
+        data.analysis_period_days,
+        chat.total_messages,
+        chat.user_messages,
+        chat.question_count,
+        chat.avg_message_length,
+        chat.thumbs_up_count,
+        chat.thumbs_down_count,
+        chat.unique_sessions,
+        chat.total_session_duration_minutes,
+        material.total_time_spent_seconds,
+        material.total_views,
+        material.unique_materials_viewed,
+        material.bookmark_count,
+        material.avg_scroll_depth,
+        activity.active_days,
+        activity.total_sessions,
+        activity.peak_hour,
+        activity.late_night_sessions,
+        activity.weekend_sessions,
+        activity.daily_activity_variance,
+        quiz.quiz_attempts if quiz is not None else 0,
+        quiz.avg_score if quiz is not None else 0.0,
+        quiz.completion_rate if quiz is not None else 0.0,
+    )
+
+
+# Raw values of a user with no recorded activity (all model defaults)
+EMPTY_BEHAVIOR_ROW = behavior_row(BehaviorData(user_id=""))
+
+
+@dataclass(slots=True)
+class BehaviorBatch:
+    """
+    Structure-of-arrays view over many BehaviorData records.
+    
+    Holds one contiguous float64 array per raw input field, built in a single
+    pass over the records, so batch extraction can feed NumPy operations
+    directly instead of re-reading pydantic attributes per user. Missing quiz
+    data is stored as zero attempts, which yields the same defaults as the
+    scalar extraction path.
+    """
+    analysis_period_days: np.ndarray
+    # Chat fields
+    total_messages: np.ndarray
+    user_messages: np.ndarray
+    question_count: np.ndarray
+    avg_message_length: np.ndarray
+    thumbs_up_count: np.ndarray
+    thumbs_down_count: np.ndarray
+    unique_sessions: np.ndarray
+    total_session_duration_minutes: np.ndarray
+    # Material fields
+    total_time_spent_seconds: np.ndarray
+    total_views: np.ndarray
+    unique_materials_viewed: np.ndarray
+    bookmark_count: np.ndarray
+    avg_scroll_depth: np.ndarray
+    # Activity fields
+    active_days: np.ndarray
+    total_sessions: np.ndarray
+    peak_hour: np.ndarray
+    late_night_sessions: np.ndarray
+    weekend_sessions: np.ndarray
+    daily_activity_variance: np.ndarray
+    # Quiz fields
+    quiz_attempts: np.ndarray
+    avg_score: np.ndarray
+    completion_rate: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.analysis_period_days)
+    
+    @classmethod
+    def from_list(cls, items: List[BehaviorData]) -> "BehaviorBatch":
+        """
+        Build a batch from a list of BehaviorData records.
+        
+        Args:
+            items: Behavior data for N users
+            
+        Returns:
+            BehaviorBatch with one length-N array per field
+        """
+        rows = [behavior_row(data) for data in items]
+        
+        # Transpose into field-major order so every column is contiguous
+        num_fields = len(fields(cls))
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), num_fields)
+        return cls(*np.ascontiguousarray(matrix.T))
+
 
 class FeatureExtractor:
     """
@@ -42,22 +162,45 @@ class FeatureExtractor:
     MAX_VIEWS = 200
     MAX_SESSIONS_PER_DAY = 10
     MAX_QUIZ_ATTEMPTS = 50
+    MAX_MESSAGES_PER_SESSION = 20.0  # high chat engagement per session
+    MAX_AVG_TIME_PER_VIEW_SECONDS = 600.0  # 10 minutes per view is high engagement
+    MAX_VARIANCE = 10.0  # daily activity variance treated as very inconsistent
     
-    def __init__(self, scaler_path: Optional[str] = None):
+    # Precomputed reciprocals so normalization is a multiply and a clamp.
+    # Raw counts are validated as non-negative, so only the upper bound is clamped.
+    INV_MAX_MESSAGE_LENGTH = 1.0 / MAX_MESSAGE_LENGTH
+    INV_MAX_SESSIONS = 1.0 / MAX_SESSIONS
+    INV_MAX_SESSION_DURATION = 1.0 / MAX_SESSION_DURATION
+    INV_MAX_TIME_SPENT = 1.0 / MAX_TIME_SPENT
+    INV_MAX_VIEWS = 1.0 / MAX_VIEWS
+    INV_MAX_SESSIONS_PER_DAY = 1.0 / MAX_SESSIONS_PER_DAY
+    INV_MAX_QUIZ_ATTEMPTS = 1.0 / MAX_QUIZ_ATTEMPTS
+    
+    def __init__(self, scaler_path: Optional[str] = None, cache_size: int = 0):
         """
         Initialize the feature extractor.
         
         Args:
             scaler_path: Optional path to a saved scaler for consistent inference
+            cache_size: Number of feature vectors to memoize in extract(), keyed
+                by the raw behavior values (0 disables caching). Useful when
+                clients re-request predictions for unchanged data.
         """
         self.scaler = None
         self.scaler_path = scaler_path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, FeatureVector]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Cold-start users all map to this vector; see extract()
+        self._empty_feature_vector = self._build_feature_vector(BehaviorData(user_id=""))
         if scaler_path:
             self._load_scaler(scaler_path)
     
     def _load_scaler(self, scaler_path: str) -> None:
         """
-        Load a saved scaler from file using joblib.
+        Load a saved scaler from file (joblib, or a plain pickle for .pkl).
+        
+        Repeated loads of an unchanged file share one deserialized scaler.
         
         Validates: Requirement 9.5 - Serialize the scaler alongside the model
         
@@ -67,7 +210,7 @@ class FeatureExtractor:
         try:
             path = Path(scaler_path)
             if path.exists():
-                self.scaler = joblib.load(scaler_path)
+                self.scaler = load_artifact(scaler_path)
                 logger.info(f"Loaded scaler from {scaler_path}")
             else:
                 logger.warning(f"Scaler file not found at {scaler_path}, using default normalization")
@@ -77,7 +220,10 @@ class FeatureExtractor:
     
     def save_scaler(self, scaler_path: str, scaler: object) -> None:
         """
-        Save a scaler to file using joblib for consistent inference.
+        Save a scaler to file for consistent inference.
+        
+        A .pkl path writes a plain protocol-5 pickle, which loads faster than
+        a joblib file; other paths keep the joblib format.
         
         Validates: Requirement 9.5 - Serialize the scaler alongside the model
         
@@ -88,7 +234,7 @@ class FeatureExtractor:
         try:
             path = Path(scaler_path)
             path.parent.mkdir(parents=True, exist_ok=True)
-            joblib.dump(scaler, scaler_path)
+            save_artifact(scaler, scaler_path)
             self.scaler = scaler
             self.scaler_path = scaler_path
             logger.info(f"Saved scaler to {scaler_path}")
@@ -115,53 +261,337 @@ class FeatureExtractor:
         Returns:
             Normalized feature vector for ML model input with all values in [0, 1]
         """
-        # Extract features from each category
-        chat_features = self._extract_chat_features(data)
-        material_features = self._extract_material_features(data)
-        activity_features = self._extract_activity_features(data)
-        quiz_features = self._extract_quiz_features(data)
+        # New users with no activity yet resolve to a fixed vector. The cheap
+        # count checks filter out everyone else before the full comparison.
+        if (
+            not data.chat.total_messages
+            and not data.material.total_views
+            and not data.activity.total_sessions
+            and data.quiz is None
+            and behavior_row(data) == EMPTY_BEHAVIOR_ROW
+        ):
+            return self._empty_feature_vector.model_copy()
+        
+        if self.cache_size <= 0:
+            return self._build_feature_vector(data)
+        
+        # Features depend only on the raw numeric values, not on user_id
+        key = behavior_row(data)
+        with self._cache_lock:
+            feature_vector = self._cache.get(key)
+            if feature_vector is not None:
+                self._cache.move_to_end(key)
+        
+        if feature_vector is None:
+            feature_vector = self._build_feature_vector(data)
+            with self._cache_lock:
+                self._cache[key] = feature_vector
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        
+        # Hand out copies so callers can't mutate the cached instance
+        return feature_vector.model_copy()
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized feature vectors."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _build_feature_vector(self, data: BehaviorData) -> FeatureVector:
+        """Compute the FeatureVector for extract() without consulting the cache."""
+        # Extract features from each category as tuples in field order
+        (
+            chat_message_ratio,
+            question_frequency,
+            avg_message_length_norm,
+            feedback_ratio,
+            feedback_engagement,
+            session_count_norm,
+            messages_per_session,
+            session_duration_norm,
+        ) = self._compute_chat_features(data)
+        (
+            time_spent_norm,
+            view_count_norm,
+            material_diversity,
+            avg_time_per_view_norm,
+            bookmark_ratio,
+            scroll_depth,
+            material_engagement_score,
+        ) = self._compute_material_features(data)
+        (
+            active_days_ratio,
+            session_frequency,
+            consistency_score,
+            late_night_ratio,
+            weekend_ratio,
+            peak_hour_norm,
+            engagement_trend_encoded,
+        ) = self._compute_activity_features(data)
+        (
+            quiz_score_norm,
+            quiz_completion_norm,
+            quiz_attempt_frequency,
+        ) = self._compute_quiz_features(data)
         
         # Combine all features into a FeatureVector
-        # All features are already normalized to [0, 1] by the extraction methods
+        # All features are already normalized to [0, 1] by the extraction methods.
+        # Validated keyword construction is deliberate: pydantic-core checks these
+        # 25 floats faster than model_construct() or a zipped kwargs dict.
         feature_vector = FeatureVector(
             # Chat features (8)
-            chat_message_ratio=chat_features["chat_message_ratio"],
-            question_frequency=chat_features["question_frequency"],
-            avg_message_length_norm=chat_features["avg_message_length_norm"],
-            feedback_ratio=chat_features["feedback_ratio"],
-            feedback_engagement=chat_features["feedback_engagement"],
-            session_count_norm=chat_features["session_count_norm"],
-            messages_per_session=chat_features["messages_per_session"],
-            session_duration_norm=chat_features["session_duration_norm"],
+            chat_message_ratio=chat_message_ratio,
+            question_frequency=question_frequency,
+            avg_message_length_norm=avg_message_length_norm,
+            feedback_ratio=feedback_ratio,
+            feedback_engagement=feedback_engagement,
+            session_count_norm=session_count_norm,
+            messages_per_session=messages_per_session,
+            session_duration_norm=session_duration_norm,
             
             # Material features (7)
-            time_spent_norm=material_features["time_spent_norm"],
-            view_count_norm=material_features["view_count_norm"],
-            material_diversity=material_features["material_diversity"],
-            avg_time_per_view_norm=material_features["avg_time_per_view_norm"],
-            bookmark_ratio=material_features["bookmark_ratio"],
-            scroll_depth=material_features["scroll_depth"],
-            material_engagement_score=material_features["material_engagement_score"],
+            time_spent_norm=time_spent_norm,
+            view_count_norm=view_count_norm,
+            material_diversity=material_diversity,
+            avg_time_per_view_norm=avg_time_per_view_norm,
+            bookmark_ratio=bookmark_ratio,
+            scroll_depth=scroll_depth,
+            material_engagement_score=material_engagement_score,
             
             # Activity features (7)
-            active_days_ratio=activity_features["active_days_ratio"],
-            session_frequency=activity_features["session_frequency"],
-            consistency_score=activity_features["consistency_score"],
-            late_night_ratio=activity_features["late_night_ratio"],
-            weekend_ratio=activity_features["weekend_ratio"],
-            peak_hour_norm=activity_features["peak_hour_norm"],
-            engagement_trend_encoded=activity_features["engagement_trend_encoded"],
+            active_days_ratio=active_days_ratio,
+            session_frequency=session_frequency,
+            consistency_score=consistency_score,
+            late_night_ratio=late_night_ratio,
+            weekend_ratio=weekend_ratio,
+            peak_hour_norm=peak_hour_norm,
+            engagement_trend_encoded=engagement_trend_encoded,
             
             # Quiz features (3)
-            quiz_score_norm=quiz_features["quiz_score_norm"],
-            quiz_completion_norm=quiz_features["quiz_completion_norm"],
-            quiz_attempt_frequency=quiz_features["quiz_attempt_frequency"],
+            quiz_score_norm=quiz_score_norm,
+            quiz_completion_norm=quiz_completion_norm,
+            quiz_attempt_frequency=quiz_attempt_frequency,
         )
         
         logger.debug(f"Extracted feature vector for user {data.user_id}")
         return feature_vector
     
+    def extract_batch(self, data: List[BehaviorData]) -> np.ndarray:
+        """
+        Extract normalized features for many users at once.
+        
+        Vectorized counterpart of extract() for bulk scoring. The input is
+        converted once into a BehaviorBatch (one array per raw field) and all
+        25 features are computed with NumPy array operations instead of
+        per-user Python arithmetic. The formulas, defaults and caps are
+        identical to the scalar extraction methods.
+        
+        Args:
+            data: Behavior data for N users
+        
+        The result is float32: every feature lies in [0, 1] and the tree
+        models cast their input to float32 anyway, so this halves the matrix
+        size without changing predictions. FeatureVector (the API payload)
+        keeps Python floats.
+        
+        Returns:
+            Float32 array of shape (N, 25) with columns in FEATURE_NAMES
+            order, suitable for direct model input
+            
+        Raises:
+            ValueError: If inconsistent input (e.g. more user messages than
+                total messages) yields a feature outside [0, 1], the same
+                input that makes extract() fail FeatureVector validation
+        """
+        batch = BehaviorBatch.from_list(data)
+        columns = [
+            *self._extract_chat_columns(batch).values(),
+            *self._extract_material_columns(batch).values(),
+            *self._extract_activity_columns(batch).values(),
+            *self._extract_quiz_columns(batch).values(),
+        ]
+        features = np.empty((len(batch), len(columns)), dtype=np.float32)
+        for i, column in enumerate(columns):
+            features[:, i] = column
+        
+        out_of_range = (features < 0.0) | (features > 1.0)
+        if out_of_range.any():
+            rows, cols = np.nonzero(out_of_range)
+            raise ValueError(
+                f"Features out of [0, 1] range for {len(np.unique(rows))} row(s); "
+                f"first: row {rows[0]} ({data[rows[0]].user_id}), "
+                f"{FEATURE_NAMES[cols[0]]}={features[rows[0], cols[0]]:.4g}"
+            )
+        return features
+    
+    def extract_and_scale_batch(self, data: List[BehaviorData]) -> np.ndarray:
+        """
+        Extract features for many users and apply the loaded scaler once.
+        
+        The whole (N, 25) matrix goes through a single scaler.transform() call
+        instead of one call per user. Without a loaded scaler the unscaled
+        features are returned.
+        
+        For classification, pass the result to
+        PersonaClassifier.predict_array(..., scaled=True) so the classifier
+        does not scale it again. That is only correct when this extractor
+        loaded the same scaler as the classifier; otherwise hand
+        extract_batch() output to predict_array() unscaled.
+        
+        Args:
+            data: Behavior data for N users
+            
+        Returns:
+            Array of shape (N, 25), scaled if a scaler is loaded
+        """
+        features = self.extract_batch(data)
+        if self.scaler is None or len(features) == 0:
+            return features
+        return self.scaler.transform(features)
+    
+    def _extract_chat_columns(self, batch: BehaviorBatch) -> dict:
+        """Batch version of _compute_chat_features (Requirements 2.1-2.8)."""
+        total_feedback = batch.thumbs_up_count + batch.thumbs_down_count
+        return {
+            "chat_message_ratio": self._safe_divide_array(
+                batch.user_messages, batch.total_messages, 0.5
+            ),
+            "question_frequency": np.minimum(
+                1.0, self._safe_divide_array(batch.question_count, batch.user_messages, 0.0)
+            ),
+            "avg_message_length_norm": self._normalize_array(
+                batch.avg_message_length, self.MAX_MESSAGE_LENGTH
+            ),
+            "feedback_ratio": self._safe_divide_array(
+                batch.thumbs_up_count, total_feedback, 0.5
+            ),
+            "feedback_engagement": np.minimum(
+                1.0, self._safe_divide_array(total_feedback, batch.total_messages, 0.0)
+            ),
+            "session_count_norm": self._normalize_array(
+                batch.unique_sessions, self.MAX_SESSIONS
+            ),
+            "messages_per_session": self._normalize_array(
+                self._safe_divide_array(batch.total_messages, batch.unique_sessions, 0.0),
+                self.MAX_MESSAGES_PER_SESSION,
+            ),
+            "session_duration_norm": self._normalize_array(
+                batch.total_session_duration_minutes, self.MAX_SESSION_DURATION
+            ),
+        }
+    
+    def _extract_material_columns(self, batch: BehaviorBatch) -> dict:
+        """Batch version of _compute_material_features (Requirements 3.1-3.7)."""
+        time_spent_norm = self._normalize_array(
+            batch.total_time_spent_seconds, self.MAX_TIME_SPENT
+        )
+        bookmark_ratio = np.minimum(
+            1.0, self._safe_divide_array(batch.bookmark_count, batch.total_views, 0.0)
+        )
+        scroll_depth = np.clip(batch.avg_scroll_depth, 0.0, 1.0)
+        return {
+            "time_spent_norm": time_spent_norm,
+            "view_count_norm": self._normalize_array(batch.total_views, self.MAX_VIEWS),
+            "material_diversity": np.minimum(
+                1.0,
+                self._safe_divide_array(batch.unique_materials_viewed, batch.total_views, 0.0),
+            ),
+            "avg_time_per_view_norm": self._normalize_array(
+                self._safe_divide_array(
+                    batch.total_time_spent_seconds, batch.total_views, 0.0
+                ),
+                self.MAX_AVG_TIME_PER_VIEW_SECONDS,
+            ),
+            "bookmark_ratio": bookmark_ratio,
+            "scroll_depth": scroll_depth,
+            "material_engagement_score": np.clip(
+                0.4 * time_spent_norm + 0.4 * scroll_depth + 0.2 * bookmark_ratio, 0.0, 1.0
+            ),
+        }
+    
+    def _extract_activity_columns(self, batch: BehaviorBatch) -> dict:
+        """Batch version of _compute_activity_features (Requirements 4.1-4.7)."""
+        active_days_ratio = self._safe_divide_array(
+            batch.active_days, batch.analysis_period_days, 0.0
+        )
+        session_frequency = self._safe_divide_array(
+            batch.total_sessions, batch.active_days, 0.0
+        )
+        late_night_ratio = self._safe_divide_array(
+            batch.late_night_sessions, batch.total_sessions, 0.0
+        )
+        
+        # Engagement trend (same heuristics as _score_engagement_trend)
+        has_sessions = batch.total_sessions > 0
+        declining_score = (
+            (batch.daily_activity_variance > 5.0).astype(np.int8)
+            + ((active_days_ratio < 0.3) & has_sessions)
+            + ((session_frequency < 0.5) & (batch.active_days > 0))
+            + (late_night_ratio > 0.4)
+        )
+        increasing_score = (
+            (batch.daily_activity_variance < 2.0).astype(np.int8)
+            + (active_days_ratio > 0.6)
+            + (session_frequency > 2.0)
+        )
+        engagement_trend_encoded = np.select(
+            [declining_score >= 2, increasing_score >= 2],
+            [TREND_TO_CODE[EngagementTrend.DECLINING], TREND_TO_CODE[EngagementTrend.INCREASING]],
+            default=TREND_TO_CODE[EngagementTrend.STABLE],
+        )
+        # No sessions at all is treated as stable (neutral)
+        engagement_trend_encoded[~has_sessions] = TREND_TO_CODE[EngagementTrend.STABLE]
+        
+        return {
+            "active_days_ratio": np.minimum(1.0, active_days_ratio),
+            "session_frequency": self._normalize_array(
+                session_frequency, self.MAX_SESSIONS_PER_DAY
+            ),
+            "consistency_score": np.clip(
+                1.0 - self._normalize_array(batch.daily_activity_variance, self.MAX_VARIANCE),
+                0.0,
+                1.0,
+            ),
+            "late_night_ratio": np.minimum(1.0, late_night_ratio),
+            "weekend_ratio": np.minimum(
+                1.0, self._safe_divide_array(batch.weekend_sessions, batch.total_sessions, 0.0)
+            ),
+            "peak_hour_norm": np.clip(batch.peak_hour / 23.0, 0.0, 1.0),
+            "engagement_trend_encoded": engagement_trend_encoded,
+        }
+    
+    def _extract_quiz_columns(self, batch: BehaviorBatch) -> dict:
+        """Batch version of _compute_quiz_features (Requirements 9.2-9.4)."""
+        has_attempts = batch.quiz_attempts > 0
+        return {
+            "quiz_score_norm": np.where(
+                has_attempts, np.clip(batch.avg_score / 100.0, 0.0, 1.0), 0.5
+            ),
+            "quiz_completion_norm": np.where(
+                has_attempts, np.clip(batch.completion_rate, 0.0, 1.0), 0.5
+            ),
+            "quiz_attempt_frequency": self._normalize_array(
+                batch.quiz_attempts, self.MAX_QUIZ_ATTEMPTS
+            ),
+        }
+    
     def _extract_chat_features(self, data: BehaviorData) -> dict:
+        """Chat features keyed by name (see _compute_chat_features)."""
+        return dict(zip(CHAT_FEATURE_NAMES, self._compute_chat_features(data)))
+    
+    def _extract_material_features(self, data: BehaviorData) -> dict:
+        """Material features keyed by name (see _compute_material_features)."""
+        return dict(zip(MATERIAL_FEATURE_NAMES, self._compute_material_features(data)))
+    
+    def _extract_activity_features(self, data: BehaviorData) -> dict:
+        """Activity features keyed by name (see _compute_activity_features)."""
+        return dict(zip(ACTIVITY_FEATURE_NAMES, self._compute_activity_features(data)))
+    
+    def _extract_quiz_features(self, data: BehaviorData) -> dict:
+        """Quiz features keyed by name (see _compute_quiz_features)."""
+        return dict(zip(QUIZ_FEATURE_NAMES, self._compute_quiz_features(data)))
+    
+    def _compute_chat_features(self, data: BehaviorData) -> Tuple[float, ...]:
         """
         Extract chat-related features.
         
@@ -177,85 +607,68 @@ class FeatureExtractor:
         
         Validates: Requirements 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 2.8
         """
+        # Bind raw fields to locals once; the arithmetic below reads them repeatedly
         chat = data.chat
+        total_messages = chat.total_messages
+        user_messages = chat.user_messages
+        question_count = chat.question_count
+        avg_message_length = chat.avg_message_length
+        thumbs_up_count = chat.thumbs_up_count
+        thumbs_down_count = chat.thumbs_down_count
+        unique_sessions = chat.unique_sessions
+        total_session_duration_minutes = chat.total_session_duration_minutes
         
         # Requirement 2.2: Calculate ratio of user messages to total messages
         # Default to 0.5 (neutral) if no messages exist
-        chat_message_ratio = self._safe_divide(
-            chat.user_messages, 
-            chat.total_messages, 
-            default=0.5
-        )
+        chat_message_ratio = user_messages / total_messages if total_messages else 0.5
         
         # Requirement 2.3: Calculate question frequency (questions / user messages)
         # Default to 0 if no user messages exist
-        question_frequency = self._safe_divide(
-            chat.question_count, 
-            chat.user_messages, 
-            default=0.0
-        )
+        question_frequency = question_count / user_messages if user_messages else 0.0
         # Normalize to [0, 1] - cap at 1.0 (100% questions)
         question_frequency = min(1.0, question_frequency)
         
         # Requirement 2.4: Normalize average message length
-        avg_message_length_norm = self._normalize(
-            chat.avg_message_length, 
-            self.MAX_MESSAGE_LENGTH
-        )
+        avg_message_length_norm = avg_message_length * self.INV_MAX_MESSAGE_LENGTH
+        avg_message_length_norm = 1.0 if avg_message_length_norm > 1.0 else avg_message_length_norm
         
         # Requirements 2.5, 2.6: Calculate feedback ratio
         # thumbs_up / (thumbs_up + thumbs_down), default to 0.5 if no feedback
-        total_feedback = chat.thumbs_up_count + chat.thumbs_down_count
-        feedback_ratio = self._safe_divide(
-            chat.thumbs_up_count, 
-            total_feedback, 
-            default=0.5
-        )
+        total_feedback = thumbs_up_count + thumbs_down_count
+        feedback_ratio = thumbs_up_count / total_feedback if total_feedback else 0.5
         
         # Calculate feedback engagement: total_feedback / total_messages
         # Default to 0 if no messages exist
-        feedback_engagement = self._safe_divide(
-            total_feedback, 
-            chat.total_messages, 
-            default=0.0
-        )
+        feedback_engagement = total_feedback / total_messages if total_messages else 0.0
         # Normalize to [0, 1] - cap at 1.0
         feedback_engagement = min(1.0, feedback_engagement)
         
         # Requirement 2.7: Normalize session count
-        session_count_norm = self._normalize(
-            chat.unique_sessions, 
-            self.MAX_SESSIONS
-        )
+        session_count_norm = unique_sessions * self.INV_MAX_SESSIONS
+        session_count_norm = 1.0 if session_count_norm > 1.0 else session_count_norm
         
         # Requirement 2.8: Calculate messages per session
         # Default to 0 if no sessions exist
-        raw_messages_per_session = self._safe_divide(
-            chat.total_messages, 
-            chat.unique_sessions, 
-            default=0.0
-        )
+        raw_messages_per_session = total_messages / unique_sessions if unique_sessions else 0.0
         # Normalize: assume max ~20 messages per session is high engagement
-        messages_per_session = self._normalize(raw_messages_per_session, 20.0)
+        messages_per_session = self._normalize(raw_messages_per_session, self.MAX_MESSAGES_PER_SESSION)
         
         # Normalize session duration
-        session_duration_norm = self._normalize(
-            chat.total_session_duration_minutes, 
-            self.MAX_SESSION_DURATION
+        session_duration_norm = total_session_duration_minutes * self.INV_MAX_SESSION_DURATION
+        session_duration_norm = 1.0 if session_duration_norm > 1.0 else session_duration_norm
+        
+        return (
+            chat_message_ratio,
+            question_frequency,
+            avg_message_length_norm,
+            feedback_ratio,
+            feedback_engagement,
+            session_count_norm,
+            messages_per_session,
+            session_duration_norm,
         )
-        
-        return {
-            "chat_message_ratio": chat_message_ratio,
-            "question_frequency": question_frequency,
-            "avg_message_length_norm": avg_message_length_norm,
-            "feedback_ratio": feedback_ratio,
-            "feedback_engagement": feedback_engagement,
-            "session_count_norm": session_count_norm,
-            "messages_per_session": messages_per_session,
-            "session_duration_norm": session_duration_norm,
-        }
     
-    def _extract_material_features(self, data: BehaviorData) -> dict:
+    def _compute_material_features(self, data: BehaviorData) -> Tuple[float, ...]:
         """
         Extract material interaction features.
         
@@ -270,52 +683,42 @@ class FeatureExtractor:
         
         Validates: Requirements 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7
         """
+        # Bind raw fields to locals once; the arithmetic below reads them repeatedly
         material = data.material
+        total_time_spent_seconds = material.total_time_spent_seconds
+        total_views = material.total_views
+        unique_materials_viewed = material.unique_materials_viewed
+        bookmark_count = material.bookmark_count
+        avg_scroll_depth = material.avg_scroll_depth
         
         # Requirement 3.1: Calculate total time spent on materials (normalized)
-        time_spent_norm = self._normalize(
-            material.total_time_spent_seconds,
-            self.MAX_TIME_SPENT
-        )
+        time_spent_norm = total_time_spent_seconds * self.INV_MAX_TIME_SPENT
+        time_spent_norm = 1.0 if time_spent_norm > 1.0 else time_spent_norm
         
         # Requirement 3.2: Count total material views (normalized)
-        view_count_norm = self._normalize(
-            material.total_views,
-            self.MAX_VIEWS
-        )
+        view_count_norm = total_views * self.INV_MAX_VIEWS
+        view_count_norm = 1.0 if view_count_norm > 1.0 else view_count_norm
         
         # Requirement 3.3: Calculate material diversity (unique / total views)
         # Default to 0 if no views exist
-        material_diversity = self._safe_divide(
-            material.unique_materials_viewed,
-            material.total_views,
-            default=0.0
-        )
+        material_diversity = unique_materials_viewed / total_views if total_views else 0.0
         # Cap at 1.0 (unique can't exceed total views in valid data)
         material_diversity = min(1.0, material_diversity)
         
         # Requirement 3.4: Calculate average time per material view
         # Default to 0 if no views exist
-        avg_time_per_view = self._safe_divide(
-            material.total_time_spent_seconds,
-            material.total_views,
-            default=0.0
-        )
+        avg_time_per_view = total_time_spent_seconds / total_views if total_views else 0.0
         # Normalize: assume max ~600 seconds (10 minutes) per view is high engagement
-        avg_time_per_view_norm = self._normalize(avg_time_per_view, 600.0)
+        avg_time_per_view_norm = self._normalize(avg_time_per_view, self.MAX_AVG_TIME_PER_VIEW_SECONDS)
         
         # Requirements 3.5, 3.6: Calculate bookmark ratio (bookmarks / views)
         # Default to 0 if no views exist
-        bookmark_ratio = self._safe_divide(
-            material.bookmark_count,
-            material.total_views,
-            default=0.0
-        )
+        bookmark_ratio = bookmark_count / total_views if total_views else 0.0
         # Cap at 1.0 (can't have more bookmarks than views in typical usage)
         bookmark_ratio = min(1.0, bookmark_ratio)
         
         # Requirement 3.7: Scroll depth average (already in [0, 1] range)
-        scroll_depth = material.avg_scroll_depth
+        scroll_depth = avg_scroll_depth
         # Ensure it's within bounds
         scroll_depth = max(0.0, min(1.0, scroll_depth))
         
@@ -330,17 +733,17 @@ class FeatureExtractor:
         # Ensure it's within [0, 1] bounds
         material_engagement_score = max(0.0, min(1.0, material_engagement_score))
         
-        return {
-            "time_spent_norm": time_spent_norm,
-            "view_count_norm": view_count_norm,
-            "material_diversity": material_diversity,
-            "avg_time_per_view_norm": avg_time_per_view_norm,
-            "bookmark_ratio": bookmark_ratio,
-            "scroll_depth": scroll_depth,
-            "material_engagement_score": material_engagement_score,
-        }
+        return (
+            time_spent_norm,
+            view_count_norm,
+            material_diversity,
+            avg_time_per_view_norm,
+            bookmark_ratio,
+            scroll_depth,
+            material_engagement_score,
+        )
     
-    def _extract_activity_features(self, data: BehaviorData) -> dict:
+    def _compute_activity_features(self, data: BehaviorData) -> Tuple[float, ...]:
         """
         Extract activity pattern features.
         
@@ -355,36 +758,38 @@ class FeatureExtractor:
         
         Validates: Requirements 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7
         """
+        # Bind raw fields to locals once; the arithmetic below reads them repeatedly
         activity = data.activity
+        active_days = activity.active_days
+        total_sessions = activity.total_sessions
+        peak_hour = activity.peak_hour
+        late_night_sessions = activity.late_night_sessions
+        weekend_sessions = activity.weekend_sessions
+        daily_activity_variance = activity.daily_activity_variance
         
         # Requirement 4.1: Calculate active_days_ratio
         # active_days / analysis_period_days
         # Default to 0 if analysis_period_days is 0 (shouldn't happen due to validation)
-        active_days_ratio = self._safe_divide(
-            activity.active_days,
-            data.analysis_period_days,
-            default=0.0
+        analysis_period_days = data.analysis_period_days
+        raw_active_days_ratio = (
+            active_days / analysis_period_days if analysis_period_days else 0.0
         )
         # Cap at 1.0 (active_days can't exceed analysis_period in valid data)
-        active_days_ratio = min(1.0, active_days_ratio)
+        active_days_ratio = min(1.0, raw_active_days_ratio)
         
         # Requirement 4.2: Calculate session_frequency
         # total_sessions / active_days
         # Default to 0 if no active days
-        raw_session_frequency = self._safe_divide(
-            activity.total_sessions,
-            activity.active_days,
-            default=0.0
-        )
+        raw_session_frequency = total_sessions / active_days if active_days else 0.0
         # Normalize: assume max ~10 sessions per day is high frequency
-        session_frequency = self._normalize(raw_session_frequency, self.MAX_SESSIONS_PER_DAY)
+        session_frequency = raw_session_frequency * self.INV_MAX_SESSIONS_PER_DAY
+        session_frequency = 1.0 if session_frequency > 1.0 else session_frequency
         
         # Requirement 4.3: Calculate consistency_score
         # consistency_score = 1 - normalized_variance
         # Higher variance = less consistent, so we invert it
-        # Normalize variance: assume max variance of 10.0 is very inconsistent
-        MAX_VARIANCE = 10.0
-        normalized_variance = self._normalize(activity.daily_activity_variance, MAX_VARIANCE)
+        # Normalize variance against MAX_VARIANCE (very inconsistent)
+        normalized_variance = self._normalize(daily_activity_variance, self.MAX_VARIANCE)
         consistency_score = 1.0 - normalized_variance
         # Ensure it's within [0, 1] bounds
         consistency_score = max(0.0, min(1.0, consistency_score))
@@ -392,53 +797,48 @@ class FeatureExtractor:
         # Requirement 4.5: Calculate late_night_ratio
         # late_night_sessions / total_sessions
         # Default to 0 if no sessions
-        late_night_ratio = self._safe_divide(
-            activity.late_night_sessions,
-            activity.total_sessions,
-            default=0.0
-        )
+        raw_late_night_ratio = late_night_sessions / total_sessions if total_sessions else 0.0
         # Cap at 1.0 (late_night_sessions can't exceed total_sessions)
-        late_night_ratio = min(1.0, late_night_ratio)
+        late_night_ratio = min(1.0, raw_late_night_ratio)
         
         # Requirement 4.6: Calculate weekend_ratio
         # weekend_sessions / total_sessions
         # Default to 0 if no sessions
-        weekend_ratio = self._safe_divide(
-            activity.weekend_sessions,
-            activity.total_sessions,
-            default=0.0
-        )
+        weekend_ratio = weekend_sessions / total_sessions if total_sessions else 0.0
         # Cap at 1.0 (weekend_sessions can't exceed total_sessions)
         weekend_ratio = min(1.0, weekend_ratio)
         
         # Requirement 4.4: Normalize peak_hour
         # peak_hour is 0-23, normalize to [0, 1]
-        peak_hour_norm = activity.peak_hour / 23.0 if activity.peak_hour <= 23 else 1.0
+        peak_hour_norm = peak_hour / 23.0 if peak_hour <= 23 else 1.0
         # Ensure it's within [0, 1] bounds
         peak_hour_norm = max(0.0, min(1.0, peak_hour_norm))
         
         # Requirement 4.7: Calculate engagement_trend_encoded
         # Determine engagement trend and encode as:
         # declining = 0, stable = 0.5, increasing = 1
-        engagement_trend = self._calculate_engagement_trend(data)
-        if engagement_trend == EngagementTrend.DECLINING:
-            engagement_trend_encoded = 0.0
-        elif engagement_trend == EngagementTrend.STABLE:
-            engagement_trend_encoded = 0.5
-        else:  # INCREASING
-            engagement_trend_encoded = 1.0
-        
-        return {
-            "active_days_ratio": active_days_ratio,
-            "session_frequency": session_frequency,
-            "consistency_score": consistency_score,
-            "late_night_ratio": late_night_ratio,
-            "weekend_ratio": weekend_ratio,
-            "peak_hour_norm": peak_hour_norm,
-            "engagement_trend_encoded": engagement_trend_encoded,
-        }
+        # Reuses the ratios computed above instead of re-deriving them
+        engagement_trend = self._score_engagement_trend(
+            total_sessions=total_sessions,
+            active_days=active_days,
+            daily_activity_variance=daily_activity_variance,
+            active_days_ratio=raw_active_days_ratio,
+            session_frequency=raw_session_frequency,
+            late_night_ratio=raw_late_night_ratio,
+        )
+        engagement_trend_encoded = TREND_TO_CODE[engagement_trend]
+        
+        return (
+            active_days_ratio,
+            session_frequency,
+            consistency_score,
+            late_night_ratio,
+            weekend_ratio,
+            peak_hour_norm,
+            engagement_trend_encoded,
+        )
     
-    def _extract_quiz_features(self, data: BehaviorData) -> dict:
+    def _compute_quiz_features(self, data: BehaviorData) -> Tuple[float, ...]:
         """
         Extract quiz performance features.
         
@@ -455,7 +855,8 @@ class FeatureExtractor:
             data: Complete behavior data for a user
             
         Returns:
-            Dictionary with quiz features, using defaults if quiz data is missing
+            Tuple of quiz features in QUIZ_FEATURE_NAMES order, using defaults
+            if quiz data is missing
         """
         # Check if quiz data is available
         if data.quiz is None:
@@ -463,17 +864,18 @@ class FeatureExtractor:
             # - 0.5 for ratio-based features (quiz_score_norm, quiz_completion_norm)
             # - 0.0 for count-based features (quiz_attempt_frequency)
             logger.debug(f"No quiz data for user {data.user_id}, using default values")
-            return {
-                "quiz_score_norm": 0.5,  # Ratio-based default
-                "quiz_completion_norm": 0.5,  # Ratio-based default
-                "quiz_attempt_frequency": 0.0,  # Count-based default
-            }
+            return (
+                0.5,  # quiz_score_norm: ratio-based default
+                0.5,  # quiz_completion_norm: ratio-based default
+                0.0,  # quiz_attempt_frequency: count-based default
+            )
         
         quiz = data.quiz
+        quiz_attempts = quiz.quiz_attempts
         
         # Normalize quiz score: avg_score is 0-100, normalize to [0, 1]
         # If avg_score is 0 and no attempts, use default 0.5
-        if quiz.quiz_attempts == 0:
+        if quiz_attempts == 0:
             quiz_score_norm = 0.5  # Ratio-based default for no data
         else:
             quiz_score_norm = quiz.avg_score / 100.0
@@ -482,7 +884,7 @@ class FeatureExtractor:
         
         # Quiz completion rate is already in [0, 1] range
         # If no attempts, use default 0.5
-        if quiz.quiz_attempts == 0:
+        if quiz_attempts == 0:
             quiz_completion_norm = 0.5  # Ratio-based default for no data
         else:
             quiz_completion_norm = quiz.completion_rate
@@ -491,21 +893,53 @@ class FeatureExtractor:
         
         # Normalize quiz attempt frequency
         # Use 0 as default for count-based feature
-        quiz_attempt_frequency = self._normalize(
-            quiz.quiz_attempts,
-            self.MAX_QUIZ_ATTEMPTS
-        )
+        quiz_attempt_frequency = quiz_attempts * self.INV_MAX_QUIZ_ATTEMPTS
+        quiz_attempt_frequency = 1.0 if quiz_attempt_frequency > 1.0 else quiz_attempt_frequency
         
-        return {
-            "quiz_score_norm": quiz_score_norm,
-            "quiz_completion_norm": quiz_completion_norm,
-            "quiz_attempt_frequency": quiz_attempt_frequency,
-        }
+        return (
+            quiz_score_norm,
+            quiz_completion_norm,
+            quiz_attempt_frequency,
+        )
     
     def _calculate_engagement_trend(self, data: BehaviorData) -> EngagementTrend:
         """
         Determine if engagement is increasing, stable, or declining.
         
+        Standalone entry point that derives the activity ratios from the raw
+        data. The extraction pass calls _score_engagement_trend directly with
+        the ratios it has already computed.
+        
+        Validates: Requirement 4.7
+        """
+        activity = data.activity
+        return self._score_engagement_trend(
+            total_sessions=activity.total_sessions,
+            active_days=activity.active_days,
+            daily_activity_variance=activity.daily_activity_variance,
+            active_days_ratio=self._safe_divide(
+                activity.active_days, data.analysis_period_days, default=0.0
+            ),
+            session_frequency=self._safe_divide(
+                activity.total_sessions, activity.active_days, default=0.0
+            ),
+            late_night_ratio=self._safe_divide(
+                activity.late_night_sessions, activity.total_sessions, default=0.0
+            ),
+        )
+    
+    def _score_engagement_trend(
+        self,
+        total_sessions: int,
+        active_days: int,
+        daily_activity_variance: float,
+        active_days_ratio: float,
+        session_frequency: float,
+        late_night_ratio: float,
+    ) -> EngagementTrend:
+        """
+        Score the engagement trend from precomputed (uncapped) activity ratios.
+        
         Based on activity variance and session patterns over the analysis period.
         Uses heuristics based on:
         - Daily activity variance (high variance may indicate declining engagement)
@@ -514,33 +948,10 @@ class FeatureExtractor:
         
         Validates: Requirement 4.7
         """
-        activity = data.activity
-        
         # If no sessions at all, consider it stable (neutral)
-        if activity.total_sessions == 0:
+        if total_sessions == 0:
             return EngagementTrend.STABLE
         
-        # Calculate session frequency (sessions per active day)
-        session_frequency = self._safe_divide(
-            activity.total_sessions,
-            activity.active_days,
-            default=0.0
-        )
-        
-        # Calculate active days ratio
-        active_days_ratio = self._safe_divide(
-            activity.active_days,
-            data.analysis_period_days,
-            default=0.0
-        )
-        
-        # Calculate late night ratio
-        late_night_ratio = self._safe_divide(
-            activity.late_night_sessions,
-            activity.total_sessions,
-            default=0.0
-        )
-        
         # Heuristics for engagement trend:
         # 
         # DECLINING indicators:
@@ -555,38 +966,25 @@ class FeatureExtractor:
         #
         # STABLE: everything else
         
-        declining_score = 0
-        increasing_score = 0
-        
-        # Variance-based scoring
-        if activity.daily_activity_variance > 5.0:
-            declining_score += 1
-        elif activity.daily_activity_variance < 2.0:
-            increasing_score += 1
-        
-        # Active days ratio scoring
-        if active_days_ratio < 0.3 and activity.total_sessions > 0:
-            declining_score += 1
-        elif active_days_ratio > 0.6:
-            increasing_score += 1
-        
-        # Session frequency scoring
-        if session_frequency > 2.0:
-            increasing_score += 1
-        elif session_frequency < 0.5 and activity.active_days > 0:
-            declining_score += 1
-        
-        # Late night activity scoring (high late night may indicate stress)
-        if late_night_ratio > 0.4:
-            declining_score += 1
+        # Each indicator is a comparison summed as 0/1; the paired declining and
+        # increasing checks test disjoint ranges, so at most one of each pair counts.
+        # (total_sessions > 0 is guaranteed past the early return above.)
+        declining_score = (
+            (daily_activity_variance > 5.0)  # Variance-based scoring
+            + (active_days_ratio < 0.3)  # Active days ratio scoring
+            + (session_frequency < 0.5 and active_days > 0)  # Session frequency scoring
+            + (late_night_ratio > 0.4)  # High late night may indicate stress
+        )
+        increasing_score = (
+            (daily_activity_variance < 2.0)
+            + (active_days_ratio > 0.6)
+            + (session_frequency > 2.0)
+        )
         
         # Determine trend based on scores
         if declining_score >= 2:
             return EngagementTrend.DECLINING
-        elif increasing_score >= 2:
-            return EngagementTrend.INCREASING
-        else:
-            return EngagementTrend.STABLE
+        return EngagementTrend.INCREASING if increasing_score >= 2 else EngagementTrend.STABLE
     
     def _safe_divide(self, numerator: float, denominator: float, default: float = 0.0) -> float:
         """Safely divide two numbers, returning default if denominator is zero."""
@@ -598,4 +996,21 @@ class FeatureExtractor:
         """Normalize a value to [0, 1] range using min-max scaling."""
         if max_value <= 0:
             return 0.0
-        return min(1.0, max(0.0, value / max_value))
+        value = value / max_value
+        return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+    
+    @staticmethod
+    def _safe_divide_array(
+        numerator: np.ndarray, denominator: np.ndarray, default: float = 0.0
+    ) -> np.ndarray:
+        """Element-wise safe division, using default wherever the denominator is zero."""
+        out = np.full(numerator.shape, default, dtype=np.float64)
+        return np.divide(numerator, denominator, out=out, where=denominator != 0)
+    
+    @staticmethod
+    def _normalize_array(values: np.ndarray, max_value: float) -> np.ndarray:
+        """Element-wise min-max normalization to the [0, 1] range."""
+        if max_value <= 0:
+            return np.zeros(values.shape, dtype=np.float64)
+        normalized = values * (1.0 / max_value)
+        return np.clip(normalized, 0.0, 1.0, out=normalized)
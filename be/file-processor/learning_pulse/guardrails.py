@@ -9,11 +9,16 @@ with educational best practices. Handles:
 - Override reason tracking (Requirement 5.6)
 """
 
-from typing import Optional, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar, Final, Optional, List, Tuple
 import logging
 
+import numpy as np
+
 from .models import (
     LearningPersona,
+    PersonaCode,
     FeatureVector,
     ClassificationResult,
     GuardrailResult,
@@ -23,6 +28,101 @@ from .models import (
 
 logger = logging.getLogger("learning_pulse.guardrails")
 
+# Override thresholds
+MASTER_MIN_QUIZ_SCORE: Final = 50.0  # Requirement 5.1
+SKIMMER_MIN_TIME_PER_MATERIAL: Final = 300  # seconds, Requirement 5.2
+DEEP_DIVER_MIN_MATERIALS: Final = 3  # Requirement 5.3
+
+# Flag thresholds
+ANXIOUS_LATE_NIGHT_THRESHOLD: Final = 0.5  # Requirement 5.4
+ANXIOUS_SESSION_FREQUENCY_THRESHOLD: Final = 0.3  # normalized session_frequency
+HIGH_SESSION_FREQUENCY_THRESHOLD: Final = 3.0  # sessions per day
+DECLINING_TREND_THRESHOLD: Final = 0.25  # engagement_trend_encoded below this is declining
+
+# Reason templates with the thresholds already substituted
+MASTER_REASON_TEMPLATE: Final = (
+    f"Quiz score ({{:.1f}}%) is below {MASTER_MIN_QUIZ_SCORE}% threshold for Master classification"
+)
+SKIMMER_REASON_TEMPLATE: Final = (
+    f"Average time per material ({{:.0f}}s) exceeds {SKIMMER_MIN_TIME_PER_MATERIAL}s, "
+    "reconsidering classification"
+)
+DEEP_DIVER_REASON_TEMPLATE: Final = (
+    f"Total materials viewed ({{}}) is below {DEEP_DIVER_MIN_MATERIALS} minimum "
+    "for Deep Diver classification"
+)
+ANXIOUS_REASON_TEMPLATE: Final = (
+    "High late-night activity ({:.0%}) combined with frequent sessions indicates potential anxiety"
+)
+BURNOUT_REASON: Final = (
+    "Declining engagement trend from previous Master classification indicates potential burnout"
+)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _format_reason(template: str, value: float) -> str:
+    """
+    Render a reason template, memoized per (template, value).
+
+    Keyed on the exact, typed value rather than a rounded bucket so the text
+    always matches the uncached format (3 and 3.0 render differently under
+    "{}"); repeated values such as material counts skip the formatting.
+    """
+    return template.format(value)
+
+
+# Personas that have an override rule (Requirements 5.1-5.3)
+OVERRIDE_PERSONAS: Final = frozenset({
+    LearningPersona.MASTER,
+    LearningPersona.DEEP_DIVER,
+    LearningPersona.SKIMMER,
+})
+
+# Persona code used by apply_batch when the previous persona is unknown
+NO_PERSONA_CODE: Final = -1
+
+# Override rule ids reported by apply_batch (0 = no override)
+RULE_NONE: Final = 0
+RULE_MASTER_LOW_QUIZ_SCORE: Final = 1
+RULE_DEEP_DIVER_LOW_MATERIAL_COUNT: Final = 2
+RULE_SKIMMER_HIGH_TIME_PER_MATERIAL: Final = 3
+
+# GuardrailOverride.rule_triggered names, indexed by rule id. Shared literals,
+# so every override record references the same interned string.
+RULE_NAMES: Final = (
+    None,
+    "master_low_quiz_score",
+    "deep_diver_low_material_count",
+    "skimmer_high_time_per_material",
+)
+
+# Flag bits, shared by apply() and apply_batch
+FLAG_POTENTIAL_ANXIOUS: Final = 1
+FLAG_POTENTIAL_BURNOUT: Final = 2
+
+
+@dataclass(frozen=True, slots=True)
+class GuardrailBatchResult:
+    """
+    Guardrail outcome for N users as parallel arrays.
+    
+    personas holds PersonaCode values after overrides, rules the RULE_* id that
+    fired per user, and flags a bitmask of FLAG_* values.
+    """
+    personas: np.ndarray
+    rules: np.ndarray
+    flags: np.ndarray
+    
+    @property
+    def was_overridden(self) -> np.ndarray:
+        """Boolean mask of users whose persona was overridden."""
+        return self.rules != RULE_NONE
+    
+    @property
+    def needs_attention(self) -> np.ndarray:
+        """Boolean mask of users with any flag raised or an override applied."""
+        return (self.flags != 0) | self.was_overridden
+
 
 class LogicGuardrails:
     """
@@ -33,14 +133,17 @@ class LogicGuardrails:
     for attention without changing the classification.
     """
     
-    # Override thresholds
-    MASTER_MIN_QUIZ_SCORE = 50.0  # Requirement 5.1
-    SKIMMER_MIN_TIME_PER_MATERIAL = 300  # seconds, Requirement 5.2
-    DEEP_DIVER_MIN_MATERIALS = 3  # Requirement 5.3
+    # Thresholds, aliased from the module constants the rules read directly
+    MASTER_MIN_QUIZ_SCORE = MASTER_MIN_QUIZ_SCORE
+    SKIMMER_MIN_TIME_PER_MATERIAL = SKIMMER_MIN_TIME_PER_MATERIAL
+    DEEP_DIVER_MIN_MATERIALS = DEEP_DIVER_MIN_MATERIALS
+    ANXIOUS_LATE_NIGHT_THRESHOLD = ANXIOUS_LATE_NIGHT_THRESHOLD
+    ANXIOUS_SESSION_FREQUENCY_THRESHOLD = ANXIOUS_SESSION_FREQUENCY_THRESHOLD
+    HIGH_SESSION_FREQUENCY_THRESHOLD = HIGH_SESSION_FREQUENCY_THRESHOLD
+    DECLINING_TREND_THRESHOLD = DECLINING_TREND_THRESHOLD
     
-    # Flag thresholds
-    ANXIOUS_LATE_NIGHT_THRESHOLD = 0.5  # Requirement 5.4
-    HIGH_SESSION_FREQUENCY_THRESHOLD = 3.0  # sessions per day
+    # Shared result for the common case where nothing fired
+    _EMPTY_FLAGS: ClassVar[GuardrailFlags] = GuardrailFlags()
     
     def apply(
         self,
@@ -54,6 +157,10 @@ class LogicGuardrails:
         """
         Apply pedagogical rules to classification.
         
+        Personas are compared by identity, so previous_persona must be a
+        LearningPersona member (not its raw string value), as
+        ClassificationResult.persona already is.
+        
         Args:
             prediction: Raw ML classification result
             features: Extracted feature vector
@@ -65,21 +172,37 @@ class LogicGuardrails:
         Returns:
             GuardrailResult with potentially overridden persona and flags
         """
-        override: Optional[GuardrailOverride] = None
         final_persona = prediction.persona
+        
+        # Fast path: no override rule exists for this persona and the necessary
+        # condition of each flag rule fails, so nothing can fire
+        if (
+            final_persona not in OVERRIDE_PERSONAS
+            and features.late_night_ratio <= ANXIOUS_LATE_NIGHT_THRESHOLD
+            and previous_persona is not LearningPersona.MASTER
+        ):
+            return GuardrailResult(
+                persona=final_persona,
+                confidence=prediction.confidence,
+                was_overridden=False,
+                flags=self._EMPTY_FLAGS,
+            )
+        
+        override: Optional[GuardrailOverride] = None
         was_overridden = False
         
-        # Check override rules in priority order
+        # Override rules are mutually exclusive on the predicted persona, so
+        # dispatch once and evaluate only the rule that can apply
         # Rule 1: Master → Struggler when quiz_score < 50% (Requirement 5.1)
-        if override is None:
+        if final_persona is LearningPersona.MASTER:
             override = self._check_master_override(prediction, quiz_score)
         
         # Rule 2: Deep_Diver → Lost when materials_viewed < 3 (Requirement 5.3)
-        if override is None:
+        elif final_persona is LearningPersona.DEEP_DIVER:
             override = self._check_deep_diver_override(prediction, total_materials_viewed)
         
         # Rule 3: Skimmer reconsideration when time_per_material > 300s (Requirement 5.2)
-        if override is None:
+        elif final_persona is LearningPersona.SKIMMER:
             override = self._check_skimmer_reconsideration(prediction, avg_time_per_material)
         
         # Apply override if one was triggered
@@ -87,29 +210,31 @@ class LogicGuardrails:
             final_persona = override.final_persona
             was_overridden = True
             logger.warning(
-                f"Guardrail override: {override.original_persona.value} -> {override.final_persona.value} "
-                f"(rule: {override.rule_triggered})"
+                "Guardrail override: %s -> %s (rule: %s)",
+                override.original_persona.value,
+                override.final_persona.value,
+                override.rule_triggered,
             )
         
-        # Check flag rules (these don't override, just raise flags)
-        flag_reasons: List[str] = []
-        
-        # Check for Anxious indicators (Requirement 5.4)
-        anxious_flags = self._check_anxious_flags(features)
-        flag_reasons.extend(anxious_flags)
-        
-        # Check for Burnout indicators (Requirement 5.5)
-        burnout_flags = self._check_burnout_flags(features, previous_persona)
-        flag_reasons.extend(burnout_flags)
-        
-        # Build flags object
-        flags = GuardrailFlags(
-            potential_anxious=len(anxious_flags) > 0,
-            potential_burnout=len(burnout_flags) > 0,
-            needs_attention=len(flag_reasons) > 0 or was_overridden,
-            flag_reasons=flag_reasons,
+        # Check flag rules (these don't override, just raise flags) as FLAG_* bits
+        # Anxious indicators (Requirement 5.4), Burnout indicators (Requirement 5.5)
+        flag_bits = (
+            self._check_anxious_flags(features)
+            | self._check_burnout_flags(features, previous_persona)
         )
         
+        # Build flags object, reusing the shared empty flags when nothing fired;
+        # reason strings are only rendered for flags that are set
+        if flag_bits or was_overridden:
+            flags = GuardrailFlags(
+                potential_anxious=bool(flag_bits & FLAG_POTENTIAL_ANXIOUS),
+                potential_burnout=bool(flag_bits & FLAG_POTENTIAL_BURNOUT),
+                needs_attention=True,
+                flag_reasons=self._flag_reasons(flag_bits, features),
+            )
+        else:
+            flags = self._EMPTY_FLAGS
+        
         return GuardrailResult(
             persona=final_persona,
             confidence=prediction.confidence,
@@ -118,6 +243,79 @@ class LogicGuardrails:
             flags=flags,
         )
     
+    def apply_batch(
+        self,
+        persona_codes: np.ndarray,
+        late_night_ratio: np.ndarray,
+        session_frequency: np.ndarray,
+        engagement_trend_encoded: np.ndarray,
+        quiz_scores: Optional[np.ndarray] = None,
+        previous_persona_codes: Optional[np.ndarray] = None,
+        total_materials_viewed: Optional[np.ndarray] = None,
+        avg_time_per_material: Optional[np.ndarray] = None,
+    ) -> GuardrailBatchResult:
+        """
+        Apply the same rules as apply() to many users with array operations.
+        
+        Inputs are length-N arrays. Missing values follow apply()'s defaults:
+        quiz scores use NaN for "no score", previous personas use
+        NO_PERSONA_CODE, and omitted arrays behave like the scalar defaults.
+        
+        Args:
+            persona_codes: Predicted personas as PersonaCode values
+            late_night_ratio: late_night_ratio feature per user
+            session_frequency: session_frequency feature per user
+            engagement_trend_encoded: engagement_trend_encoded feature per user
+            quiz_scores: Optional quiz scores (0-100, NaN when unknown)
+            previous_persona_codes: Optional previous personas as PersonaCode values
+            total_materials_viewed: Optional materials viewed per user
+            avg_time_per_material: Optional average seconds per material
+            
+        Returns:
+            GuardrailBatchResult with final personas, fired rules and flags
+        """
+        personas = np.asarray(persona_codes)
+        n = len(personas)
+        rules = np.zeros(n, dtype=np.int8)
+        
+        # Override rules (Requirements 5.1-5.3); mutually exclusive on persona.
+        # NaN quiz scores compare False, matching "no quiz score".
+        if quiz_scores is not None:
+            rules[
+                (personas == PersonaCode.MASTER)
+                & (np.asarray(quiz_scores) < MASTER_MIN_QUIZ_SCORE)
+            ] = RULE_MASTER_LOW_QUIZ_SCORE
+        if total_materials_viewed is None:
+            total_materials_viewed = np.zeros(n)
+        rules[
+            (personas == PersonaCode.DEEP_DIVER)
+            & (np.asarray(total_materials_viewed) < DEEP_DIVER_MIN_MATERIALS)
+        ] = RULE_DEEP_DIVER_LOW_MATERIAL_COUNT
+        if avg_time_per_material is not None:
+            rules[
+                (personas == PersonaCode.SKIMMER)
+                & (np.asarray(avg_time_per_material) > SKIMMER_MIN_TIME_PER_MATERIAL)
+            ] = RULE_SKIMMER_HIGH_TIME_PER_MATERIAL
+        
+        final_personas = personas.copy()
+        final_personas[rules == RULE_MASTER_LOW_QUIZ_SCORE] = PersonaCode.STRUGGLER
+        final_personas[rules == RULE_DEEP_DIVER_LOW_MATERIAL_COUNT] = PersonaCode.LOST
+        final_personas[rules == RULE_SKIMMER_HIGH_TIME_PER_MATERIAL] = PersonaCode.DEEP_DIVER
+        
+        # Flag rules (Requirements 5.4-5.5)
+        flags = np.zeros(n, dtype=np.int8)
+        flags[
+            (np.asarray(late_night_ratio) > ANXIOUS_LATE_NIGHT_THRESHOLD)
+            & (np.asarray(session_frequency) > ANXIOUS_SESSION_FREQUENCY_THRESHOLD)
+        ] |= FLAG_POTENTIAL_ANXIOUS
+        if previous_persona_codes is not None:
+            flags[
+                (np.asarray(engagement_trend_encoded) < DECLINING_TREND_THRESHOLD)
+                & (np.asarray(previous_persona_codes) == PersonaCode.MASTER)
+            ] |= FLAG_POTENTIAL_BURNOUT
+        
+        return GuardrailBatchResult(personas=final_personas, rules=rules, flags=flags)
+    
     def _check_master_override(
         self,
         prediction: ClassificationResult,
@@ -128,16 +326,15 @@ class LogicGuardrails:
         
         Rule: IF persona is Master AND quiz_score < 50%, THEN override to Struggler
         (Requirement 5.1)
-        """
-        if prediction.persona != LearningPersona.MASTER:
-            return None
         
-        if quiz_score is not None and quiz_score < self.MASTER_MIN_QUIZ_SCORE:
+        Only called by apply() for Master predictions.
+        """
+        if quiz_score is not None and quiz_score < MASTER_MIN_QUIZ_SCORE:
             return GuardrailOverride(
                 original_persona=LearningPersona.MASTER,
                 final_persona=LearningPersona.STRUGGLER,
-                rule_triggered="master_low_quiz_score",
-                reason=f"Quiz score ({quiz_score:.1f}%) is below {self.MASTER_MIN_QUIZ_SCORE}% threshold for Master classification",
+                rule_triggered=RULE_NAMES[RULE_MASTER_LOW_QUIZ_SCORE],
+                reason=_format_reason(MASTER_REASON_TEMPLATE, quiz_score),
             )
         
         return None
@@ -152,17 +349,16 @@ class LogicGuardrails:
         
         Rule: IF persona is Skimmer AND avg_time_per_material > 300s, THEN reconsider
         (Requirement 5.2)
-        """
-        if prediction.persona != LearningPersona.SKIMMER:
-            return None
         
-        if avg_time_per_material > self.SKIMMER_MIN_TIME_PER_MATERIAL:
+        Only called by apply() for Skimmer predictions.
+        """
+        if avg_time_per_material > SKIMMER_MIN_TIME_PER_MATERIAL:
             # Reconsider - might be Deep Diver instead
             return GuardrailOverride(
                 original_persona=LearningPersona.SKIMMER,
                 final_persona=LearningPersona.DEEP_DIVER,
-                rule_triggered="skimmer_high_time_per_material",
-                reason=f"Average time per material ({avg_time_per_material:.0f}s) exceeds {self.SKIMMER_MIN_TIME_PER_MATERIAL}s, reconsidering classification",
+                rule_triggered=RULE_NAMES[RULE_SKIMMER_HIGH_TIME_PER_MATERIAL],
+                reason=_format_reason(SKIMMER_REASON_TEMPLATE, avg_time_per_material),
             )
         
         return None
@@ -177,16 +373,15 @@ class LogicGuardrails:
         
         Rule: IF persona is Deep_Diver AND total_materials_viewed < 3, THEN override to Lost
         (Requirement 5.3)
-        """
-        if prediction.persona != LearningPersona.DEEP_DIVER:
-            return None
         
-        if total_materials_viewed < self.DEEP_DIVER_MIN_MATERIALS:
+        Only called by apply() for Deep Diver predictions.
+        """
+        if total_materials_viewed < DEEP_DIVER_MIN_MATERIALS:
             return GuardrailOverride(
                 original_persona=LearningPersona.DEEP_DIVER,
                 final_persona=LearningPersona.LOST,
-                rule_triggered="deep_diver_low_material_count",
-                reason=f"Total materials viewed ({total_materials_viewed}) is below {self.DEEP_DIVER_MIN_MATERIALS} minimum for Deep Diver classification",
+                rule_triggered=RULE_NAMES[RULE_DEEP_DIVER_LOW_MATERIAL_COUNT],
+                reason=_format_reason(DEEP_DIVER_REASON_TEMPLATE, total_materials_viewed),
             )
         
         return None
@@ -194,44 +389,53 @@ class LogicGuardrails:
     def _check_anxious_flags(
         self,
         features: FeatureVector,
-    ) -> List[str]:
+    ) -> int:
         """
         Check for Anxious behavior indicators.
         
         Rule: IF late_night_ratio > 0.5 AND session_frequency is high, THEN flag potential Anxious
         (Requirement 5.4)
+        
+        Returns FLAG_POTENTIAL_ANXIOUS if the rule fires, else 0.
         """
-        flags = []
+        # The late-night test is the more selective one, so check it first
+        if features.late_night_ratio <= ANXIOUS_LATE_NIGHT_THRESHOLD:
+            return 0
         
-        # Check late night + high frequency combination
-        if features.late_night_ratio > self.ANXIOUS_LATE_NIGHT_THRESHOLD:
-            # session_frequency is normalized, so we check against a threshold
-            if features.session_frequency > 0.3:  # Indicates high frequency
-                flags.append(
-                    f"High late-night activity ({features.late_night_ratio:.0%}) combined with frequent sessions indicates potential anxiety"
-                )
+        # session_frequency is normalized, so we check against a threshold
+        if features.session_frequency <= ANXIOUS_SESSION_FREQUENCY_THRESHOLD:
+            return 0
         
-        return flags
+        return FLAG_POTENTIAL_ANXIOUS
     
     def _check_burnout_flags(
         self,
         features: FeatureVector,
         previous_persona: Optional[LearningPersona],
-    ) -> List[str]:
+    ) -> int:
         """
         Check for Burnout indicators.
         
         Rule: IF engagement_trend is declining AND previous_persona was Master, THEN flag potential Burnout
         (Requirement 5.5)
-        """
-        flags = []
         
+        Returns FLAG_POTENTIAL_BURNOUT if the rule fires, else 0.
+        """
         # engagement_trend_encoded: 0=declining, 0.5=stable, 1=increasing
-        is_declining = features.engagement_trend_encoded < 0.25
+        is_declining = features.engagement_trend_encoded < DECLINING_TREND_THRESHOLD
         
-        if is_declining and previous_persona == LearningPersona.MASTER:
-            flags.append(
-                "Declining engagement trend from previous Master classification indicates potential burnout"
-            )
+        if is_declining and previous_persona is LearningPersona.MASTER:
+            return FLAG_POTENTIAL_BURNOUT
         
-        return flags
+        return 0
+    
+    def _flag_reasons(self, flag_bits: int, features: FeatureVector) -> Tuple[str, ...]:
+        """Render the reason strings for the FLAG_* bits set in flag_bits."""
+        flag_reasons: List[str] = []
+        if flag_bits & FLAG_POTENTIAL_ANXIOUS:
+            flag_reasons.append(
+                _format_reason(ANXIOUS_REASON_TEMPLATE, features.late_night_ratio)
+            )
+        if flag_bits & FLAG_POTENTIAL_BURNOUT:
+            flag_reasons.append(BURNOUT_REASON)
+        return tuple(flag_reasons)
@@ -9,9 +9,9 @@ predictive analytics system, including:
 - API request/response models
 """
 
-from enum import Enum
-from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
+from enum import Enum, IntEnum
+from typing import Optional, List, Dict, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EngagementTrend(str, Enum):
@@ -40,6 +40,15 @@ class LearningPersona(str, Enum):
     LOST = "lost"
 
 
+# Integer persona codes for array-based paths, in LearningPersona declaration
+# order (the same order as the model's class indices)
+PersonaCode = IntEnum("PersonaCode", [persona.name for persona in LearningPersona], start=0)
+
+PERSONA_CODES: Dict[LearningPersona, PersonaCode] = {
+    persona: PersonaCode[persona.name] for persona in LearningPersona
+}
+
+
 # ============================================================================
 # Input Behavior Models
 # ============================================================================
@@ -139,6 +148,10 @@ class FeatureVector(BaseModel):
     quiz_attempt_frequency: float = Field(default=0.0, ge=0.0, le=1.0)
 
 
+# Feature names in FeatureVector field order, i.e. the model input column order
+FEATURE_NAMES: Tuple[str, ...] = tuple(FeatureVector.model_fields)
+
+
 # ============================================================================
 # Classification Result Models
 # ============================================================================
@@ -153,6 +166,8 @@ class ClassificationResult(BaseModel):
 
 class GuardrailOverride(BaseModel):
     """Record of a guardrail override."""
+    model_config = ConfigDict(frozen=True)
+    
     original_persona: LearningPersona
     final_persona: LearningPersona
     rule_triggered: str
@@ -161,14 +176,20 @@ class GuardrailOverride(BaseModel):
 
 class GuardrailFlags(BaseModel):
     """Flags raised by guardrails without overriding."""
+    # Frozen, with a tuple of reasons, so the guardrails can share one
+    # instance for the no-flag case
+    model_config = ConfigDict(frozen=True)
+    
     potential_anxious: bool = False
     potential_burnout: bool = False
     needs_attention: bool = False
-    flag_reasons: List[str] = Field(default_factory=list)
+    flag_reasons: Tuple[str, ...] = ()
 
 
 class GuardrailResult(BaseModel):
     """Result after applying logic guardrails."""
+    model_config = ConfigDict(frozen=True)
+    
     persona: LearningPersona
     confidence: float = Field(ge=0.0, le=1.0)
     was_overridden: bool
@@ -182,6 +203,9 @@ class GuardrailResult(BaseModel):
 
 class Recommendation(BaseModel):
     """Single actionable recommendation."""
+    # Frozen: instances are shared static content, and hashable for set use
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     title: str
     description: str
@@ -193,8 +217,8 @@ class PersonaRecommendations(BaseModel):
     """Recommendations for a specific persona."""
     persona: LearningPersona
     summary: str
-    recommendations: List[Recommendation]
-    ui_hints: Dict[str, str] = Field(default_factory=dict)
+    recommendations: Tuple[Recommendation, ...]  # Ordered by ascending priority
+    ui_hints: Dict[str, bool] = Field(default_factory=dict)  # UI feature toggles
 
 
 # ============================================================================
@@ -8,22 +8,67 @@ using a Random Forest algorithm. Handles:
 - Probability distribution over all personas
 """
 
-from typing import Optional, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from operator import attrgetter
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 import json
 import logging
+import os
+import threading
 
-import joblib
 import numpy as np
+from sklearn.preprocessing import MinMaxScaler
 
+from .artifacts import load_artifact
 from .models import (
     LearningPersona,
     FeatureVector,
     ClassificationResult,
+    FEATURE_NAMES,
 )
 
 logger = logging.getLogger("learning_pulse.persona_classifier")
 
+# Reads all 25 features in model input order (FeatureVector field order)
+_FEATURE_GETTER = attrgetter(*FEATURE_NAMES)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def mark_inference_thread() -> None:
+    """
+    Flag the calling thread as an inference pool worker.
+    
+    Meant as a ThreadPoolExecutor initializer. Batches predicted on such a
+    thread are not split across the inference pool again, since the pool
+    the thread belongs to already runs one batch per core.
+    """
+    _thread_state.inference_worker = True
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide inference thread pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count(),
+                thread_name_prefix="persona-inference",
+                initializer=mark_inference_thread,
+            )
+        return _executor
+
+
+# Fallback class-index order when metadata has no persona_names
+_PERSONAS = tuple(LearningPersona)
+_PERSONA_VALUES = tuple(persona.value for persona in LearningPersona)
+_PERSONA_BY_VALUE = {persona.value: persona for persona in LearningPersona}
+
 
 class PersonaClassifier:
     """
@@ -45,11 +90,16 @@ class PersonaClassifier:
     # Expected number of personas
     EXPECTED_NUM_CLASSES = 10
     
+    # Batches at least this large are split across the inference thread pool
+    PARALLEL_MIN_ROWS = 256
+    
     def __init__(
         self, 
         model_path: Optional[str] = None,
         scaler_path: Optional[str] = None,
-        metadata_path: Optional[str] = None
+        metadata_path: Optional[str] = None,
+        cache_size: int = 0,
+        inference_trees: Optional[int] = None,
     ):
         """
         Initialize the persona classifier.
@@ -58,12 +108,28 @@ class PersonaClassifier:
             model_path: Path to the trained model file (.joblib)
             scaler_path: Path to the feature scaler file (.joblib)
             metadata_path: Path to the model metadata file (.json)
+            cache_size: Number of predict() results to memoize, keyed by the
+                exact feature values (0 disables caching). Entries are tied
+                to the loaded model; call clear_cache() if it is replaced.
+            inference_trees: Average only the first K trees of the forest at
+                inference, trading a little accuracy for proportionally less
+                latency. Overrides "inference_trees" in the metadata; None
+                uses the metadata value, and without one the full forest.
+        
+        Raises:
+            ValueError: If inference_trees is not between 1 and the number
+                of trees in the forest
         """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, ClassificationResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.model = None
         self.scaler = None
         self._model_version = "0.0.0"
         self._last_training_date = "unknown"
         self._persona_names: list[str] = []
+        self._persona_enums: tuple[LearningPersona, ...] = ()
+        self._inference_trees: Optional[int] = None
         
         if model_path:
             self._load_model(model_path)
@@ -73,6 +139,11 @@ class PersonaClassifier:
         
         if metadata_path:
             self._load_metadata(metadata_path)
+        
+        if inference_trees is None:
+            inference_trees = self._inference_trees
+        if inference_trees is not None and self.model is not None:
+            self._limit_trees(inference_trees)
     
     @property
     def model_version(self) -> str:
@@ -101,7 +172,7 @@ class PersonaClassifier:
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
         try:
-            self.model = joblib.load(model_path)
+            self.model = self._with_single_job(load_artifact(model_path))
             logger.info(f"Model loaded successfully from {model_path}")
             
             # Validate model has correct number of classes
@@ -120,6 +191,55 @@ class PersonaClassifier:
             self.model = None
             raise
     
+    @classmethod
+    def _with_single_job(cls, model):
+        """
+        Return a shallow copy of a loaded model with n_jobs=1, including on
+        any pipeline steps.
+        
+        The forest is saved with the n_jobs it was trained with; at inference
+        time joblib's per-call thread pool setup costs far more than walking
+        the trees for the few rows a request carries. The loaded model is
+        shared through the artifact cache, so it is copied rather than
+        modified; the trees themselves are not copied. Callers who want
+        parallel inference over large batches can set n_jobs on their
+        classifier's model without affecting other instances.
+        """
+        model = copy.copy(model)
+        steps = getattr(model, "steps", None)
+        if steps is not None:
+            model.steps = [(name, cls._with_single_job(step)) for name, step in steps]
+        if hasattr(model, "n_jobs"):
+            model.n_jobs = 1
+        return model
+    
+    def _limit_trees(self, n_trees: int) -> None:
+        """
+        Restrict inference to the first n_trees trees of the forest.
+        
+        Works on a further shallow copy, so the estimators list of other
+        instances is left alone; the trees themselves are not copied. Classification
+        outputs change slightly compared to the full forest.
+        
+        Raises:
+            ValueError: If n_trees is not between 1 and the forest size
+        """
+        estimators = getattr(self.model, "estimators_", None)
+        if estimators is None:
+            return
+        if not 1 <= n_trees <= len(estimators):
+            raise ValueError(
+                f"inference_trees must be between 1 and {len(estimators)}, got {n_trees}"
+            )
+        if n_trees == len(estimators):
+            return
+        
+        model = copy.copy(self.model)
+        model.estimators_ = estimators[:n_trees]
+        model.n_estimators = n_trees
+        self.model = model
+        logger.info(f"Using {n_trees} of {len(estimators)} trees for inference")
+    
     def _load_scaler(self, scaler_path: str) -> None:
         """
         Load a feature scaler from file.
@@ -136,7 +256,7 @@ class PersonaClassifier:
             raise FileNotFoundError(f"Scaler file not found: {scaler_path}")
         
         try:
-            self.scaler = joblib.load(scaler_path)
+            self.scaler = load_artifact(scaler_path)
             logger.info(f"Scaler loaded successfully from {scaler_path}")
         except Exception as e:
             logger.error(f"Failed to load scaler: {e}")
@@ -164,7 +284,13 @@ class PersonaClassifier:
             
             # Use persona names from metadata if not already loaded from model
             if not self._persona_names and 'persona_names' in metadata:
-                self._persona_names = metadata['persona_names']
+                # Ensure strings (not numpy types) and resolve the enum members
+                # once here rather than on every prediction
+                persona_names = [str(name) for name in metadata['persona_names']]
+                self._persona_enums = tuple(_PERSONA_BY_VALUE[name] for name in persona_names)
+                self._persona_names = persona_names
+            
+            self._inference_trees = metadata.get('inference_trees')
             
             logger.info(
                 f"Metadata loaded: version={self._model_version}, "
@@ -198,47 +324,165 @@ class PersonaClassifier:
         if not self.is_loaded():
             raise RuntimeError("Model not loaded. Call _load_model() first.")
         
-        # Convert FeatureVector to numpy array
-        feature_array = np.array([self._feature_vector_to_array(features)])
+        feature_values = self._feature_vector_to_array(features)
         
-        # Apply scaling if scaler is available
-        if self.scaler is not None:
-            feature_array = self.scaler.transform(feature_array)
+        if self.cache_size > 0:
+            with self._cache_lock:
+                result = self._cache.get(feature_values)
+                if result is not None:
+                    self._cache.move_to_end(feature_values)
+            if result is not None:
+                return self._copy_result(result)
         
-        # Get prediction and probabilities from model
-        predicted_class = self.model.predict(feature_array)[0]
-        probabilities = self.model.predict_proba(feature_array)[0]
+        # Persona (Requirement 1.1) and confidence as max probability
+        # (Requirement 1.2)
+        persona, confidence, probabilities = self._predict_values(feature_values)
         
         # Build probability dictionary
         prob_dict = self._build_probability_dict(probabilities)
         
-        # Determine confidence (max probability) - Requirement 1.2
-        confidence = float(max(probabilities))
-        
-        # Convert predicted class to LearningPersona enum - Requirement 1.1
-        # The model may return either a string persona name or an integer index
-        persona = self._convert_to_persona(predicted_class)
-        
         # Flag if confidence < 0.5 - Requirement 1.3
         is_low_confidence = confidence < self.LOW_CONFIDENCE_THRESHOLD
         
+        # %-style arguments so the message is only formatted when emitted
         if is_low_confidence:
             logger.warning(
-                f"Low confidence prediction: persona={persona.value}, "
-                f"confidence={confidence:.3f}"
+                "Low confidence prediction: persona=%s, confidence=%.3f",
+                persona.value,
+                confidence,
             )
         else:
             logger.info(
-                f"Prediction completed: persona={persona.value}, "
-                f"confidence={confidence:.3f}"
+                "Prediction completed: persona=%s, confidence=%.3f",
+                persona.value,
+                confidence,
             )
         
-        return ClassificationResult(
+        result = ClassificationResult(
             persona=persona,
             confidence=confidence,
             probabilities=prob_dict,
             is_low_confidence=is_low_confidence
         )
+        
+        if self.cache_size <= 0:
+            return result
+        
+        with self._cache_lock:
+            self._cache[feature_values] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        return self._copy_result(result)
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized predictions."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    @staticmethod
+    def _copy_result(result: ClassificationResult) -> ClassificationResult:
+        """Copy a cached result so callers can't mutate the cached instance."""
+        return result.model_copy(update={"probabilities": dict(result.probabilities)})
+    
+    def predict_batch(self, features_list: List[FeatureVector]) -> List[ClassificationResult]:
+        """
+        Predict personas for many feature vectors in one model call.
+        
+        Stacks all vectors into a single (N, 25) matrix and hands it to
+        predict_array().
+        
+        Args:
+            features_list: Normalized feature vectors
+            
+        Returns:
+            Classification results, in input order
+            
+        Raises:
+            RuntimeError: If model is not loaded
+        """
+        if not self.is_loaded():
+            raise RuntimeError("Model not loaded. Call _load_model() first.")
+        
+        if not features_list:
+            return []
+        
+        return self.predict_array(np.array(
+            [self._feature_vector_to_array(features) for features in features_list]
+        ))
+    
+    def predict_array(
+        self, feature_array: np.ndarray, scaled: bool = False
+    ) -> List[ClassificationResult]:
+        """
+        Predict personas for a prebuilt (N, 25) feature matrix.
+        
+        Accepts the output of FeatureExtractor.extract_batch() directly, so
+        bulk callers skip building FeatureVector objects. Scaling and
+        predict_proba run once for the batch; the predicted class is the
+        argmax of each probability row, as RandomForest.predict computes it.
+        
+        Output of FeatureExtractor.extract_and_scale_batch() is already
+        scaled and must be passed with scaled=True, or the scaler would be
+        applied twice.
+        
+        Args:
+            feature_array: Features, columns in FEATURE_NAMES order; unscaled
+                unless scaled is True
+            scaled: Whether feature_array has already been through the
+                scaler, in which case it is passed to the model as is
+            
+        Returns:
+            Classification results, in row order
+            
+        Raises:
+            RuntimeError: If model is not loaded
+            ValueError: If the array is not of shape (N, 25)
+        """
+        if not self.is_loaded():
+            raise RuntimeError("Model not loaded. Call _load_model() first.")
+        
+        # Same precision as the single-sample path, which the scaler was fit on
+        feature_array = np.asarray(feature_array, dtype=np.float64)
+        if feature_array.ndim != 2 or feature_array.shape[1] != len(FEATURE_NAMES):
+            raise ValueError(
+                f"Expected feature array of shape (N, {len(FEATURE_NAMES)}), "
+                f"got {feature_array.shape}"
+            )
+        
+        if len(feature_array) == 0:
+            return []
+        
+        if not scaled:
+            feature_array = self._scale(feature_array)
+        
+        probabilities = self._predict_proba_rows(feature_array)
+        predicted_indices = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(predicted_indices)), predicted_indices]
+        
+        # Map column indices back to class labels when the model exposes them
+        classes = getattr(self.model, "classes_", None)
+        predicted_classes = classes[predicted_indices] if classes is not None else predicted_indices
+        
+        results = []
+        for predicted_class, confidence, row in zip(
+            predicted_classes, confidences.tolist(), probabilities
+        ):
+            results.append(ClassificationResult(
+                persona=self._convert_to_persona(predicted_class),
+                confidence=confidence,
+                probabilities=self._build_probability_dict(row),
+                is_low_confidence=confidence < self.LOW_CONFIDENCE_THRESHOLD,
+            ))
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Batch prediction completed: size=%d, low_confidence=%d",
+                len(results),
+                int((confidences < self.LOW_CONFIDENCE_THRESHOLD).sum()),
+            )
+        
+        return results
     
     def predict_proba(self, features: FeatureVector) -> Dict[str, float]:
         """
@@ -260,14 +504,80 @@ class PersonaClassifier:
         feature_array = np.array([self._feature_vector_to_array(features)])
         
         # Apply scaling if scaler is available
-        if self.scaler is not None:
-            feature_array = self.scaler.transform(feature_array)
+        feature_array = self._scale(feature_array)
         
         # Get probabilities from model
         probabilities = self.model.predict_proba(feature_array)[0]
         
         return self._build_probability_dict(probabilities)
     
+    def predict_compact(
+        self, features: FeatureVector
+    ) -> Tuple[LearningPersona, float, np.ndarray]:
+        """
+        Predict persona without building a ClassificationResult.
+        
+        For bulk writers that persist raw outputs: skips the probability
+        dict, the result model and logging. Column order of the returned
+        probabilities matches the persona_names in model_metadata.json.
+        
+        Args:
+            features: Normalized feature vector
+            
+        Returns:
+            Tuple of (persona, confidence, probabilities array)
+            
+        Raises:
+            RuntimeError: If model is not loaded
+        """
+        if not self.is_loaded():
+            raise RuntimeError("Model not loaded. Call _load_model() first.")
+        
+        return self._predict_values(self._feature_vector_to_array(features))
+    
+    def _predict_proba_rows(self, feature_array: np.ndarray) -> np.ndarray:
+        """
+        Run predict_proba over a scaled batch, in parallel when it is large.
+        
+        sklearn's tree traversal releases the GIL, so contiguous row chunks
+        on a persistent thread pool use every core without the joblib
+        dispatch that n_jobs would pay on each call. Rows are independent,
+        so the result equals a single predict_proba call.
+        
+        On a thread flagged by mark_inference_thread() (e.g. the router's
+        prediction pool) the batch runs serially: that pool already keeps
+        every core busy, and fanning out again would oversubscribe the CPU.
+        """
+        workers = os.cpu_count() or 1
+        if (
+            workers < 2
+            or len(feature_array) < self.PARALLEL_MIN_ROWS
+            or getattr(_thread_state, "inference_worker", False)
+        ):
+            return self.model.predict_proba(feature_array)
+        
+        chunks = np.array_split(feature_array, workers)
+        return np.concatenate(list(_get_executor().map(self.model.predict_proba, chunks)))
+    
+    def _predict_values(self, feature_values: tuple) -> Tuple[LearningPersona, float, np.ndarray]:
+        """Run one unscaled feature row through the scaler and model."""
+        # Convert feature values to a (1, 25) array and apply scaling
+        feature_array = self._scale(np.array([feature_values]))
+        
+        # Get probabilities from model; the predicted class is their argmax,
+        # so a separate model.predict() would walk every tree a second time
+        probabilities = self.model.predict_proba(feature_array)[0]
+        predicted_idx = int(np.argmax(probabilities))
+        classes = getattr(self.model, "classes_", None)
+        predicted_class = classes[predicted_idx] if classes is not None else predicted_idx
+        
+        # The model may return either a string persona name or an integer index
+        return (
+            self._convert_to_persona(predicted_class),
+            float(probabilities[predicted_idx]),
+            probabilities,
+        )
+    
     def _build_probability_dict(self, probabilities: np.ndarray) -> Dict[str, float]:
         """
         Build a dictionary mapping persona names to probabilities.
@@ -278,19 +588,11 @@ class PersonaClassifier:
         Returns:
             Dictionary mapping persona names to probabilities
         """
-        # Use persona names from model classes or metadata
-        if self._persona_names:
-            return {
-                name: float(prob) 
-                for name, prob in zip(self._persona_names, probabilities)
-            }
-        
-        # Fallback: use LearningPersona enum values in order
-        persona_values = [p.value for p in LearningPersona]
-        return {
-            name: float(prob) 
-            for name, prob in zip(persona_values, probabilities)
-        }
+        # Use persona names from metadata, falling back to LearningPersona
+        # enum values in order
+        # tolist() converts the whole row to Python floats in one call
+        persona_names = self._persona_names or _PERSONA_VALUES
+        return dict(zip(persona_names, probabilities.tolist()))
     
     def _convert_to_persona(self, predicted_class) -> LearningPersona:
         """
@@ -307,61 +609,51 @@ class PersonaClassifier:
         """
         # If it's already a string, convert directly
         if isinstance(predicted_class, str):
-            return LearningPersona(predicted_class)
+            try:
+                return _PERSONA_BY_VALUE[predicted_class]
+            except KeyError:
+                raise ValueError(f"Cannot convert {predicted_class} to LearningPersona") from None
         
         # Convert numpy integer to Python int
         idx = int(predicted_class)
         
         # Use persona names from metadata if available
-        if self._persona_names and 0 <= idx < len(self._persona_names):
-            persona_name = self._persona_names[idx]
-            # Ensure it's a string (not numpy type)
-            if not isinstance(persona_name, str):
-                persona_name = str(persona_name)
-            return LearningPersona(persona_name)
+        if 0 <= idx < len(self._persona_enums):
+            return self._persona_enums[idx]
         
         # Fallback: use LearningPersona enum values in order
-        persona_values = list(LearningPersona)
-        if 0 <= idx < len(persona_values):
-            return persona_values[idx]
+        if 0 <= idx < len(_PERSONAS):
+            return _PERSONAS[idx]
         
         raise ValueError(f"Cannot convert {predicted_class} to LearningPersona")
     
-    def _feature_vector_to_array(self, features: FeatureVector) -> list:
+    def _scale(self, feature_array: np.ndarray) -> np.ndarray:
+        """
+        Apply the loaded scaler, if any, to a float64 feature matrix.
+        
+        A MinMaxScaler is applied directly from its fitted scale_ and min_,
+        with the same operations as MinMaxScaler.transform but without
+        sklearn's per-call input validation, which costs far more than the
+        arithmetic for a single row. Other scalers go through transform().
+        """
+        scaler = self.scaler
+        if scaler is None:
+            return feature_array
+        
+        if type(scaler) is MinMaxScaler:
+            scaled = feature_array * scaler.scale_
+            scaled += scaler.min_
+            if scaler.clip:
+                np.clip(scaled, scaler.feature_range[0], scaler.feature_range[1], out=scaled)
+            return scaled
+        
+        return scaler.transform(feature_array)
+    
+    def _feature_vector_to_array(self, features: FeatureVector) -> tuple:
         """
-        Convert FeatureVector to a list for model input.
+        Convert FeatureVector to a tuple for model input.
         
         Ensures consistent feature ordering matching the training data.
         The order must match the feature_names in model_metadata.json.
         """
-        return [
-            # Chat features (8)
-            features.chat_message_ratio,
-            features.question_frequency,
-            features.avg_message_length_norm,
-            features.feedback_ratio,
-            features.feedback_engagement,
-            features.session_count_norm,
-            features.messages_per_session,
-            features.session_duration_norm,
-            # Material features (7)
-            features.time_spent_norm,
-            features.view_count_norm,
-            features.material_diversity,
-            features.avg_time_per_view_norm,
-            features.bookmark_ratio,
-            features.scroll_depth,
-            features.material_engagement_score,
-            # Activity features (7)
-            features.active_days_ratio,
-            features.session_frequency,
-            features.consistency_score,
-            features.late_night_ratio,
-            features.weekend_ratio,
-            features.peak_hour_norm,
-            features.engagement_trend_encoded,
-            # Quiz features (3)
-            features.quiz_score_norm,
-            features.quiz_completion_norm,
-            features.quiz_attempt_frequency,
-        ]
+        return _FEATURE_GETTER(features)
@@ -7,12 +7,19 @@ and Recommendation Engine into a cohesive prediction pipeline.
 Handles Requirements 7.1-7.6, 10.1-10.4.
 """
 
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from hashlib import blake2b
 import time
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from .models import (
     PredictRequest,
@@ -21,11 +28,12 @@ from .models import (
     FeatureSummary,
     LearningPersona,
     FeatureVector,
+    ClassificationResult,
 )
 from .feature_extractor import FeatureExtractor
-from .persona_classifier import PersonaClassifier
+from .persona_classifier import PersonaClassifier, mark_inference_thread
 from .guardrails import LogicGuardrails
-from .recommendations import RecommendationEngine
+from .recommendations import PERSONA_RECOMMENDATIONS
 
 logger = logging.getLogger("learning_pulse.router")
 
@@ -36,9 +44,207 @@ router = APIRouter(prefix="/api/v1/learning-pulse", tags=["Learning Pulse"])
 _feature_extractor: Optional[FeatureExtractor] = None
 _persona_classifier: Optional[PersonaClassifier] = None
 _logic_guardrails: Optional[LogicGuardrails] = None
-_recommendation_engine: Optional[RecommendationEngine] = None
+_batcher: Optional["PredictionBatcher"] = None
 _initialized: bool = False
 
+# Micro-batching limits for concurrent /predict-persona requests
+MAX_BATCH_SIZE = 32
+MAX_LATENCY_MS = 10
+
+# Runs batched inference off the event loop. One worker per core: the
+# classifier uses n_jobs=1, and mark_inference_thread() stops large batches
+# from fanning out to its own pool again, so the CPU is not oversubscribed
+_PREDICT_WORKERS = os.cpu_count() or 1
+_PREDICT_POOL = ThreadPoolExecutor(
+    max_workers=_PREDICT_WORKERS,
+    thread_name_prefix="lp-predict",
+    initializer=mark_inference_thread,
+)
+
+# Bounds for the /predict-persona response cache
+RESPONSE_CACHE_SIZE = 10_000
+RESPONSE_CACHE_TTL_SECONDS = 300
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of prediction responses with a time-to-live.
+    
+    Keyed by a digest of everything the prediction depends on, so replayed
+    payloads (retries, dashboards) skip feature extraction and inference.
+    User ids are not part of the key: users with identical behavior share
+    an entry, and hits are returned under the requesting user's id.
+    Responses are copied on the way in and out, so mutating one that was
+    stored or returned never alters the cached entry.
+    Thread-safe, as batches may complete off the event loop.
+    """
+    
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, PredictResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key_for(request: PredictRequest) -> bytes:
+        """Digest of the behavior data (minus user_id), quiz score and previous persona."""
+        behavior_json = request.behavior_data.model_dump_json(exclude={"user_id"})
+        digest = blake2b(behavior_json.encode(), digest_size=16)
+        digest.update(f"|{request.quiz_score}|{request.previous_persona}".encode())
+        return digest.digest()
+    
+    def get(self, key: bytes) -> Optional[PredictResponse]:
+        """Return a copy of the cached response for key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return self._copy_response(response)
+    
+    def put(self, key: bytes, response: PredictResponse) -> None:
+        """Store a copy of a response, evicting the least recently used beyond maxsize."""
+        response = self._copy_response(response)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    @staticmethod
+    def _copy_response(response: PredictResponse) -> PredictResponse:
+        """Copy a response's lists; the models inside them are frozen and shared."""
+        summary = response.feature_summary
+        return response.model_copy(update={
+            "recommendations": list(response.recommendations),
+            "flags": list(response.flags),
+            "feature_summary": summary.model_copy(
+                update={"key_indicators": list(summary.key_indicators)}
+            ),
+        })
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+_response_cache = ResponseCache()
+
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent classification requests into batched model calls.
+    
+    Each request queues its feature vector with a future. A background task
+    takes every request already waiting (up to max_batch_size) and resolves
+    their futures from a single PersonaClassifier.predict_batch() call, so
+    the scaler and the forest run once per batch instead of once per request.
+    
+    Batches run on _PREDICT_POOL so the event loop keeps serving requests
+    during inference. At most one batch per pool worker is in flight. If a
+    worker is free the batch is dispatched at once, so a request that
+    arrives alone pays no batching latency. Only while all workers are busy
+    does the batch wait, for up to max_latency_ms, to collect more requests
+    before taking the next free worker.
+    """
+    
+    def __init__(
+        self,
+        classifier: PersonaClassifier,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_latency_ms: float = MAX_LATENCY_MS,
+    ):
+        self.classifier = classifier
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def classify(self, features: FeatureVector) -> ClassificationResult:
+        """Queue one feature vector and wait for its batched classification."""
+        return await self.submit(features)
+    
+    def submit(self, features: FeatureVector) -> "asyncio.Future[ClassificationResult]":
+        """
+        Queue one feature vector and return a future for its classification.
+        
+        Must be called from the event loop. Lets the caller do other work
+        while the batch is collected and run.
+        """
+        loop = asyncio.get_running_loop()
+        # Started lazily, on the loop serving requests, and restarted if
+        # that loop changes (e.g. a new TestClient)
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run(self._queue))
+        
+        future = loop.create_future()
+        self._queue.put_nowait((features, future))
+        return future
+    
+    async def _run(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(_PREDICT_WORKERS)
+        while True:
+            batch = [await queue.get()]
+            self._drain(queue, batch)
+            if slots.locked():
+                # Every worker is busy, so waiting for company costs nothing extra
+                deadline = loop.time() + self.max_latency
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            await slots.acquire()
+            self._drain(queue, batch)
+            
+            inference = loop.run_in_executor(
+                _PREDICT_POOL,
+                self.classifier.predict_batch,
+                [features for features, _ in batch],
+            )
+            inference.add_done_callback(partial(self._resolve, batch, slots))
+    
+    def _drain(self, queue: asyncio.Queue, batch: list) -> None:
+        """Move requests already waiting on queue into batch, up to max_batch_size."""
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+    
+    @staticmethod
+    def _resolve(batch: list, slots: asyncio.Semaphore, inference: asyncio.Future) -> None:
+        slots.release()
+        
+        # A future is already done if its request was cancelled meanwhile
+        pending = [(i, future) for i, (_, future) in enumerate(batch) if not future.done()]
+        if inference.cancelled():
+            for _, future in pending:
+                future.cancel()
+            return
+        
+        error = inference.exception()
+        if error is not None:
+            for _, future in pending:
+                future.set_exception(error)
+            return
+        
+        results = inference.result()
+        for i, future in pending:
+            future.set_result(results[i])
+
 
 def initialize_components(
     model_path: Optional[str] = None,
@@ -54,7 +260,7 @@ def initialize_components(
     Returns:
         True if initialization successful, False otherwise
     """
-    global _feature_extractor, _persona_classifier, _logic_guardrails, _recommendation_engine, _initialized
+    global _feature_extractor, _persona_classifier, _logic_guardrails, _batcher, _initialized
     
     # Default paths relative to this module
     module_dir = Path(__file__).parent
@@ -75,7 +281,9 @@ def initialize_components(
             metadata_path=metadata_path,
         )
         _logic_guardrails = LogicGuardrails()
-        _recommendation_engine = RecommendationEngine()
+        _batcher = PredictionBatcher(_persona_classifier)
+        # Cached responses came from the previous model
+        _response_cache.clear()
         _initialized = True
         
         logger.info("Learning Pulse components initialized successfully")
@@ -155,7 +363,8 @@ def _generate_feature_summary(features: FeatureVector) -> FeatureSummary:
     elif features.active_days_ratio < 0.2:
         key_indicators.append("Sporadic activity pattern")
     
-    return FeatureSummary(
+    # Built from internal values of the declared types, so skip validation
+    return FeatureSummary.model_construct(
         chat_engagement=chat_engagement,
         material_consumption=material_consumption,
         activity_consistency=activity_consistency,
@@ -164,7 +373,7 @@ def _generate_feature_summary(features: FeatureVector) -> FeatureSummary:
 
 
 @router.post("/predict-persona", response_model=PredictResponse)
-async def predict_persona(request: PredictRequest) -> PredictResponse:
+async def predict_persona(request: PredictRequest) -> Response:
     """
     Predict learning persona for a user.
     
@@ -176,6 +385,15 @@ async def predict_persona(request: PredictRequest) -> PredictResponse:
     
     Requirements: 7.1, 7.2, 7.3, 7.6
     """
+    response = await _predict(request)
+    
+    # Serialize with pydantic-core in one pass; returning a Response skips
+    # FastAPI's re-validation and encoding of the response model
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+async def _predict(request: PredictRequest) -> PredictResponse:
+    """Run the prediction pipeline for predict_persona()."""
     start_time = time.perf_counter()
     
     # Check if components are initialized
@@ -185,12 +403,27 @@ async def predict_persona(request: PredictRequest) -> PredictResponse:
             detail="Model not available. Learning Pulse module not initialized.",
         )
     
+    cache_key = ResponseCache.key_for(request)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached.model_copy(update={
+            "user_id": request.user_id,
+            "processing_time_ms": (time.perf_counter() - start_time) * 1000,
+        })
+    
     try:
         # Step 1: Extract features from behavior_data
         features = _feature_extractor.extract(request.behavior_data)
         
-        # Step 2: Classify persona using ML model
-        classification = _persona_classifier.predict(features)
+        # Step 2: Classify persona using ML model, batched with any
+        # concurrent requests
+        pending_classification = _batcher.submit(features)
+        
+        # The feature summary depends only on the features, so generate it
+        # while the batch is collected and run
+        feature_summary = _generate_feature_summary(features)
+        
+        classification = await pending_classification
         
         # Step 3: Apply logic guardrails
         # Calculate additional metrics needed for guardrails
@@ -217,29 +450,29 @@ async def predict_persona(request: PredictRequest) -> PredictResponse:
             avg_time_per_material=avg_time_per_material,
         )
         
-        # Step 4: Get recommendations for final persona
-        persona_recommendations = _recommendation_engine.get_recommendations(
-            guardrail_result.persona
-        )
-        
-        # Step 5: Generate feature summary
-        feature_summary = _generate_feature_summary(features)
+        # Step 4: Get recommendations for final persona. The guardrails always
+        # return a LearningPersona member, all of which are in the table
+        persona_recommendations = PERSONA_RECOMMENDATIONS[guardrail_result.persona]
         
-        # Step 6: Calculate processing time
+        # Step 5: Calculate processing time
         processing_time_ms = (time.perf_counter() - start_time) * 1000
         
-        # Build response
-        return PredictResponse(
+        # Build response. Every field comes from already-validated models,
+        # so skip re-validation; the shared recommendation and flag tuples
+        # are converted to the response's declared list types
+        response = PredictResponse.model_construct(
             user_id=request.user_id,
             persona=guardrail_result.persona.value,
             confidence=guardrail_result.confidence,
             is_low_confidence=classification.is_low_confidence,
-            recommendations=persona_recommendations.recommendations,
+            recommendations=list(persona_recommendations.recommendations),
             feature_summary=feature_summary,
             override_info=guardrail_result.override,
-            flags=guardrail_result.flags.flag_reasons,
+            flags=list(guardrail_result.flags.flag_reasons),
             processing_time_ms=processing_time_ms,
         )
+        _response_cache.put(cache_key, response)
+        return response
         
     except Exception as e:
         logger.error(f"Prediction failed for user {request.user_id}: {e}")
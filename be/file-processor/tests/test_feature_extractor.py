@@ -5,8 +5,12 @@ Tests feature extraction from behavior data including:
 - Chat feature extraction (Requirements 2.1-2.8)
 - Division by zero handling
 - Feature normalization to [0, 1] range
+- Batch extraction parity with scalar extraction
 """
 
+from pathlib import Path
+
+import numpy as np
 import pytest
 
 from learning_pulse.models import (
@@ -14,8 +18,13 @@ from learning_pulse.models import (
     ChatBehavior,
     MaterialInteraction,
     ActivityPattern,
+    QuizPerformance,
+    FEATURE_NAMES,
 )
-from learning_pulse.feature_extractor import FeatureExtractor
+from learning_pulse.feature_extractor import FeatureExtractor, behavior_row
+
+
+SCALER_PATH = Path(__file__).parent.parent / "learning_pulse" / "models" / "feature_scaler.joblib"
 
 
 class TestChatFeatureExtraction:
@@ -1315,3 +1324,236 @@ class TestEngagementTrendCalculation:
         trend = extractor._calculate_engagement_trend(data)
         
         assert trend == EngagementTrend.STABLE
+
+
+class TestBatchExtraction:
+    """Tests for the vectorized extract_batch method."""
+    
+    @pytest.fixture
+    def extractor(self) -> FeatureExtractor:
+        """Create a feature extractor instance."""
+        return FeatureExtractor()
+    
+    @pytest.fixture
+    def users(self) -> list[BehaviorData]:
+        """Create a mix of empty, typical and extreme users."""
+        return [
+            BehaviorData(user_id="empty-user"),
+            BehaviorData(
+                user_id="typical-user",
+                chat=ChatBehavior(
+                    total_messages=100,
+                    user_messages=60,
+                    question_count=20,
+                    avg_message_length=120.0,
+                    thumbs_up_count=8,
+                    thumbs_down_count=2,
+                    unique_sessions=10,
+                    total_session_duration_minutes=240.0,
+                ),
+                material=MaterialInteraction(
+                    total_time_spent_seconds=7200,
+                    total_views=40,
+                    unique_materials_viewed=15,
+                    bookmark_count=5,
+                    avg_scroll_depth=0.7,
+                ),
+                activity=ActivityPattern(
+                    active_days=25,
+                    total_sessions=75,
+                    peak_hour=20,
+                    late_night_sessions=5,
+                    weekend_sessions=10,
+                    daily_activity_variance=1.0,
+                ),
+                quiz=QuizPerformance(quiz_attempts=5, avg_score=82.0, completion_rate=0.9),
+            ),
+            BehaviorData(
+                user_id="declining-user",
+                analysis_period_days=30,
+                activity=ActivityPattern(
+                    active_days=5,
+                    total_sessions=10,
+                    daily_activity_variance=8.0,
+                    late_night_sessions=5,
+                ),
+                quiz=QuizPerformance(quiz_attempts=0, avg_score=40.0, completion_rate=0.2),
+            ),
+            BehaviorData(
+                user_id="extreme-user",
+                analysis_period_days=7,
+                chat=ChatBehavior(
+                    total_messages=5000,
+                    user_messages=4000,
+                    question_count=9000,
+                    avg_message_length=2000.0,
+                    unique_sessions=1,
+                ),
+                material=MaterialInteraction(
+                    total_time_spent_seconds=100000,
+                    total_views=2,
+                    unique_materials_viewed=10,
+                    bookmark_count=10,
+                ),
+                activity=ActivityPattern(
+                    active_days=30,
+                    total_sessions=3,
+                    peak_hour=23,
+                    late_night_sessions=3,
+                    weekend_sessions=5,
+                    daily_activity_variance=50.0,
+                ),
+            ),
+        ]
+    
+    def test_batch_shape(self, extractor: FeatureExtractor, users: list[BehaviorData]):
+        """Test that extract_batch returns one 25-feature row per user."""
+        batch = extractor.extract_batch(users)
+        
+        assert batch.shape == (len(users), 25)
+        assert batch.dtype == np.float32
+    
+    def test_batch_empty_input(self, extractor: FeatureExtractor):
+        """Test that an empty batch yields an empty matrix."""
+        batch = extractor.extract_batch([])
+        
+        assert batch.shape == (0, 25)
+    
+    def test_batch_rejects_out_of_range_rows_like_scalar(
+        self, extractor: FeatureExtractor, users: list[BehaviorData]
+    ):
+        """Test that inconsistent input fails on both paths, not only extract()."""
+        inconsistent = BehaviorData(
+            user_id="inconsistent-user",
+            chat=ChatBehavior(total_messages=1, user_messages=4),
+        )
+        
+        with pytest.raises(ValueError):
+            extractor.extract(inconsistent)
+        with pytest.raises(ValueError, match="inconsistent-user.*chat_message_ratio"):
+            extractor.extract_batch([*users, inconsistent])
+    
+    def test_batch_matches_scalar_extraction(
+        self, extractor: FeatureExtractor, users: list[BehaviorData]
+    ):
+        """Test that every batch row matches the scalar extract() result."""
+        batch = extractor.extract_batch(users)
+        
+        for row, data in zip(batch, users):
+            vector = extractor.extract(data)
+            expected = [getattr(vector, name) for name in FEATURE_NAMES]
+            assert row.tolist() == pytest.approx(expected, abs=1e-6)
+    
+    def test_batch_values_in_range(self, extractor: FeatureExtractor, users: list[BehaviorData]):
+        """Test that all batch features are within [0, 1]."""
+        batch = extractor.extract_batch(users)
+        
+        assert (batch >= 0.0).all()
+        assert (batch <= 1.0).all()
+    
+    def test_extract_and_scale_batch_without_scaler(
+        self, extractor: FeatureExtractor, users: list[BehaviorData]
+    ):
+        """Test that unscaled features are returned when no scaler is loaded."""
+        scaled = extractor.extract_and_scale_batch(users)
+        
+        assert scaled.tolist() == extractor.extract_batch(users).tolist()
+    
+    def test_extract_and_scale_batch_applies_scaler(self, users: list[BehaviorData]):
+        """Test that the loaded scaler is applied to the whole batch."""
+        if not SCALER_PATH.exists():
+            pytest.skip("Scaler file not found")
+        
+        extractor = FeatureExtractor(scaler_path=str(SCALER_PATH))
+        scaled = extractor.extract_and_scale_batch(users)
+        expected = extractor.scaler.transform(extractor.extract_batch(users))
+        
+        assert scaled.ravel().tolist() == pytest.approx(expected.ravel().tolist())
+    
+    def test_empty_user_matches_full_extraction(self, extractor: FeatureExtractor):
+        """Test that the cold-start shortcut returns the fully computed vector."""
+        empty = BehaviorData(user_id="new-user")
+        
+        assert extractor.extract(empty) == extractor._build_feature_vector(empty)
+    
+    def test_empty_counts_with_other_values_are_not_shortcut(
+        self, extractor: FeatureExtractor
+    ):
+        """Test that zero counts alone do not trigger the cold-start shortcut."""
+        data = BehaviorData(
+            user_id="reader",
+            material=MaterialInteraction(avg_scroll_depth=0.9),
+            activity=ActivityPattern(peak_hour=20),
+        )
+        features = extractor.extract(data)
+        
+        assert features.scroll_depth == pytest.approx(0.9)
+        assert features.peak_hour_norm == pytest.approx(20 / 23)
+    
+    def test_save_scaler_round_trips_as_pickle(self, tmp_path, users: list[BehaviorData]):
+        """Test that a scaler saved as .pkl reloads and scales identically."""
+        if not SCALER_PATH.exists():
+            pytest.skip("Scaler file not found")
+        
+        scaler = FeatureExtractor(scaler_path=str(SCALER_PATH)).scaler
+        pickle_path = tmp_path / "scaler.pkl"
+        FeatureExtractor().save_scaler(str(pickle_path), scaler)
+        reloaded = FeatureExtractor(scaler_path=str(pickle_path))
+        
+        features = reloaded.extract_batch(users)
+        assert reloaded.scaler is not scaler
+        assert reloaded.scaler.transform(features).tolist() == scaler.transform(features).tolist()
+
+
+class TestExtractionCache:
+    """Tests for the opt-in extract() memoization."""
+    
+    @pytest.fixture
+    def data(self) -> BehaviorData:
+        return BehaviorData(
+            user_id="user-a",
+            chat=ChatBehavior(total_messages=40, user_messages=20, unique_sessions=4),
+            activity=ActivityPattern(active_days=8, total_sessions=12),
+        )
+    
+    def test_cache_disabled_by_default(self, data: BehaviorData):
+        """Test that no vectors are memoized unless a cache size is given."""
+        extractor = FeatureExtractor()
+        extractor.extract(data)
+        
+        assert len(extractor._cache) == 0
+    
+    def test_cached_result_matches_uncached(self, data: BehaviorData):
+        """Test that cache hits return the same features as a fresh extraction."""
+        cached_extractor = FeatureExtractor(cache_size=8)
+        first = cached_extractor.extract(data)
+        second = cached_extractor.extract(data.model_copy(update={"user_id": "user-b"}))
+        
+        assert first == second == FeatureExtractor().extract(data)
+        assert len(cached_extractor._cache) == 1
+    
+    def test_cached_vector_is_not_shared(self, data: BehaviorData):
+        """Test that mutating a returned vector does not alter the cache."""
+        extractor = FeatureExtractor(cache_size=8)
+        first = extractor.extract(data)
+        first.chat_message_ratio = 0.0
+        
+        assert extractor.extract(data).chat_message_ratio == pytest.approx(0.5)
+    
+    def test_cache_evicts_least_recently_used(self, data: BehaviorData):
+        """Test that a re-read entry survives and the least recent one is evicted."""
+        extractor = FeatureExtractor(cache_size=2)
+        older, newer, newest = (
+            data.model_copy(update={"activity": ActivityPattern(total_sessions=sessions)})
+            for sessions in (1, 2, 3)
+        )
+        extractor.extract(older)
+        extractor.extract(newer)
+        
+        # Re-reading the older entry makes "newer" the least recently used
+        extractor.extract(older)
+        extractor.extract(newest)
+        
+        assert list(extractor._cache) == [behavior_row(older), behavior_row(newest)]
+        extractor.clear_cache()
+        assert len(extractor._cache) == 0
@@ -5,15 +5,24 @@ Tests the override rules and flag rules for the Learning Pulse module.
 Validates Requirements 5.1, 5.2, 5.3, 5.4, 5.5, 5.6
 """
 
+import numpy as np
 import pytest
+from pydantic import ValidationError
 from learning_pulse.models import (
     LearningPersona,
     FeatureVector,
     ClassificationResult,
     GuardrailResult,
     GuardrailOverride,
+    PERSONA_CODES,
+)
+from learning_pulse.guardrails import (
+    LogicGuardrails,
+    NO_PERSONA_CODE,
+    RULE_NAMES,
+    FLAG_POTENTIAL_ANXIOUS,
+    FLAG_POTENTIAL_BURNOUT,
 )
-from learning_pulse.guardrails import LogicGuardrails
 
 
 @pytest.fixture
@@ -1038,6 +1047,35 @@ class TestFlagCombinations:
         assert result.flags.potential_burnout is False
         assert result.flags.needs_attention is False
 
+    def test_unflagged_results_share_frozen_flags(
+        self, guardrails: LogicGuardrails, sample_feature_vector: FeatureVector
+    ):
+        """Clean results should reuse one immutable empty flags object."""
+        first = guardrails.apply(
+            prediction=create_classification_result(LearningPersona.SOCIAL_LEARNER),
+            features=sample_feature_vector,
+        )
+        second = guardrails.apply(
+            prediction=create_classification_result(LearningPersona.ANXIOUS),
+            features=sample_feature_vector,
+        )
+        
+        assert first.flags is second.flags
+        assert first.flags.needs_attention is False
+        with pytest.raises(ValidationError):
+            first.flags.needs_attention = True
+        
+        # The shared reasons are immutable, so no caller can leak a reason
+        # into later results
+        assert first.flags.flag_reasons == ()
+        with pytest.raises(AttributeError):
+            first.flags.flag_reasons.append("leak")
+        third = LogicGuardrails().apply(
+            prediction=create_classification_result(LearningPersona.SOCIAL_LEARNER),
+            features=sample_feature_vector,
+        )
+        assert third.flags.flag_reasons == ()
+
 
 class TestFlagThresholds:
     """Tests for flag threshold constants."""
@@ -1049,3 +1087,73 @@ class TestFlagThresholds:
     def test_high_session_frequency_threshold(self):
         """High session frequency threshold should be 3.0."""
         assert LogicGuardrails.HIGH_SESSION_FREQUENCY_THRESHOLD == 3.0
+
+
+class TestBatchGuardrails:
+    """Tests that apply_batch matches apply() user by user."""
+
+    def test_batch_matches_scalar_rules(
+        self, guardrails: LogicGuardrails, sample_feature_vector: FeatureVector
+    ):
+        """Test parity with apply() across personas and rule boundaries."""
+        rng = np.random.default_rng(7)
+        personas = list(LearningPersona)
+        n = 500
+        
+        persona_idx = rng.integers(0, len(personas), n)
+        previous_idx = rng.integers(-1, len(personas), n)
+        quiz_scores = np.where(rng.random(n) < 0.3, np.nan, rng.uniform(0, 100, n))
+        materials = rng.integers(0, 6, n)
+        avg_time = rng.uniform(0, 600, n)
+        late_night = rng.choice([0.1, 0.5, 0.51, 0.9], n)
+        frequency = rng.choice([0.1, 0.3, 0.31, 0.8], n)
+        trend = rng.choice([0.0, 0.5, 1.0], n)
+        
+        batch = guardrails.apply_batch(
+            persona_codes=persona_idx,
+            late_night_ratio=late_night,
+            session_frequency=frequency,
+            engagement_trend_encoded=trend,
+            quiz_scores=quiz_scores,
+            previous_persona_codes=np.where(previous_idx < 0, NO_PERSONA_CODE, previous_idx),
+            total_materials_viewed=materials,
+            avg_time_per_material=avg_time,
+        )
+        
+        for i in range(n):
+            features = sample_feature_vector.model_copy(update={
+                "late_night_ratio": float(late_night[i]),
+                "session_frequency": float(frequency[i]),
+                "engagement_trend_encoded": float(trend[i]),
+            })
+            result = guardrails.apply(
+                prediction=create_classification_result(personas[persona_idx[i]]),
+                features=features,
+                quiz_score=None if np.isnan(quiz_scores[i]) else float(quiz_scores[i]),
+                previous_persona=personas[previous_idx[i]] if previous_idx[i] >= 0 else None,
+                total_materials_viewed=int(materials[i]),
+                avg_time_per_material=float(avg_time[i]),
+            )
+            
+            assert batch.personas[i] == PERSONA_CODES[result.persona]
+            assert batch.was_overridden[i] == result.was_overridden
+            if result.override is not None:
+                assert RULE_NAMES[batch.rules[i]] == result.override.rule_triggered
+            assert bool(batch.flags[i] & FLAG_POTENTIAL_ANXIOUS) == result.flags.potential_anxious
+            assert bool(batch.flags[i] & FLAG_POTENTIAL_BURNOUT) == result.flags.potential_burnout
+            assert batch.needs_attention[i] == result.flags.needs_attention
+
+    def test_batch_defaults_match_scalar_defaults(self, guardrails: LogicGuardrails):
+        """Test that omitted arrays behave like apply()'s default arguments."""
+        codes = np.array([PERSONA_CODES[p] for p in LearningPersona])
+        zeros = np.zeros(len(codes))
+        
+        batch = guardrails.apply_batch(codes, zeros, zeros, zeros)
+        
+        expected = [
+            PERSONA_CODES[LearningPersona.LOST] if p is LearningPersona.DEEP_DIVER
+            else PERSONA_CODES[p]
+            for p in LearningPersona
+        ]
+        assert batch.personas.tolist() == expected
+        assert not batch.flags.any()
@@ -8,14 +8,26 @@ Tests persona classification including:
 - Probability distribution
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 from pathlib import Path
+from sklearn.preprocessing import MinMaxScaler
 
 from learning_pulse.models import (
     LearningPersona,
     FeatureVector,
     ClassificationResult,
+    BehaviorData,
+    ChatBehavior,
+    MaterialInteraction,
+    ActivityPattern,
+    QuizPerformance,
+    FEATURE_NAMES,
 )
+from learning_pulse.feature_extractor import FeatureExtractor
+from learning_pulse import persona_classifier
 from learning_pulse.persona_classifier import PersonaClassifier
 
 
@@ -65,6 +77,67 @@ class TestPersonaClassifierLoading:
         assert classifier.model_version == "1.0.0"
         assert classifier.last_training_date != "unknown"
     
+    def test_classifier_reuses_cached_artifacts(self):
+        """Test that repeated loads of an unchanged model share one forest."""
+        if not MODEL_PATH.exists():
+            pytest.skip("Model file not found")
+        
+        first = PersonaClassifier(model_path=str(MODEL_PATH))
+        second = PersonaClassifier(model_path=str(MODEL_PATH))
+        # Each classifier holds its own shallow copy of the cached model
+        assert first.model.estimators_ is second.model.estimators_
+    
+    def test_classifier_uses_single_job_for_inference(self):
+        """Test that the loaded model does not dispatch to a joblib pool."""
+        if not MODEL_PATH.exists():
+            pytest.skip("Model file not found")
+        
+        classifier = PersonaClassifier(model_path=str(MODEL_PATH))
+        assert classifier.model.n_jobs == 1
+    
+    def test_n_jobs_does_not_leak_between_classifiers(self):
+        """Test that n_jobs is set on a copy, not on the shared cached model."""
+        if not MODEL_PATH.exists():
+            pytest.skip("Model file not found")
+        
+        first = PersonaClassifier(model_path=str(MODEL_PATH))
+        second = PersonaClassifier(model_path=str(MODEL_PATH))
+        
+        first.model.n_jobs = -1
+        assert second.model.n_jobs == 1
+    
+    def test_classifier_limits_inference_trees(self):
+        """Test that inference_trees trims a copy of the shared forest."""
+        if not MODEL_PATH.exists():
+            pytest.skip("Model file not found")
+        
+        full = PersonaClassifier(model_path=str(MODEL_PATH))
+        pruned = PersonaClassifier(model_path=str(MODEL_PATH), inference_trees=10)
+        
+        assert len(pruned.model.estimators_) == pruned.model.n_estimators == 10
+        assert len(full.model.estimators_) > 10
+        assert pruned.model.estimators_[0] is full.model.estimators_[0]
+    
+    @pytest.mark.parametrize("inference_trees", [0, -1, 10_000])
+    def test_classifier_rejects_out_of_range_inference_trees(self, inference_trees):
+        """Test that inference_trees outside 1..forest size raises ValueError."""
+        if not MODEL_PATH.exists():
+            pytest.skip("Model file not found")
+        
+        with pytest.raises(ValueError, match="inference_trees"):
+            PersonaClassifier(model_path=str(MODEL_PATH), inference_trees=inference_trees)
+    
+    def test_classifier_keeps_full_forest_for_all_trees(self):
+        """Test that inference_trees equal to the forest size keeps every tree."""
+        if not MODEL_PATH.exists():
+            pytest.skip("Model file not found")
+        
+        full = PersonaClassifier(model_path=str(MODEL_PATH))
+        n_trees = len(full.model.estimators_)
+        same = PersonaClassifier(model_path=str(MODEL_PATH), inference_trees=n_trees)
+        
+        assert len(same.model.estimators_) == n_trees
+    
     def test_classifier_raises_on_missing_model(self):
         """Test that classifier raises FileNotFoundError for missing model."""
         with pytest.raises(FileNotFoundError):
@@ -180,6 +253,17 @@ class TestPersonaClassifierPrediction:
         max_prob = max(result.probabilities.values())
         assert result.confidence == pytest.approx(max_prob)
     
+    def test_predict_persona_matches_model_predict(
+        self, classifier: PersonaClassifier, sample_feature_vector: FeatureVector
+    ):
+        """Test that the probability argmax agrees with the model's own predict."""
+        feature_array = np.array([classifier._feature_vector_to_array(sample_feature_vector)])
+        if classifier.scaler is not None:
+            feature_array = classifier.scaler.transform(feature_array)
+        expected = classifier._convert_to_persona(classifier.model.predict(feature_array)[0])
+        
+        assert classifier.predict(sample_feature_vector).persona == expected
+    
     def test_predict_raises_when_model_not_loaded(
         self, sample_feature_vector: FeatureVector
     ):
@@ -187,6 +271,138 @@ class TestPersonaClassifierPrediction:
         classifier = PersonaClassifier()
         with pytest.raises(RuntimeError, match="Model not loaded"):
             classifier.predict(sample_feature_vector)
+    
+    def test_predict_batch_matches_predict(
+        self, classifier: PersonaClassifier, sample_feature_vector: FeatureVector
+    ):
+        """Test that batched predictions match per-sample predictions."""
+        vectors = [
+            sample_feature_vector,
+            sample_feature_vector.model_copy(
+                update={"late_night_ratio": 0.9, "quiz_score_norm": 0.2}
+            ),
+            FeatureVector(**{name: 0.0 for name in FeatureVector.model_fields}),
+        ]
+        batch = classifier.predict_batch(vectors)
+        
+        assert len(batch) == len(vectors)
+        for result, vector in zip(batch, vectors):
+            single = classifier.predict(vector)
+            assert result.persona == single.persona
+            assert result.confidence == pytest.approx(single.confidence)
+            assert result.is_low_confidence == single.is_low_confidence
+            assert result.probabilities == pytest.approx(single.probabilities)
+    
+    def test_predict_array_matches_extract_batch_pipeline(
+        self, classifier: PersonaClassifier
+    ):
+        """Test that extract_batch output can be classified without FeatureVectors."""
+        extractor = FeatureExtractor()
+        users = [
+            BehaviorData(user_id="empty"),
+            BehaviorData(
+                user_id="active",
+                chat=ChatBehavior(total_messages=40, user_messages=25, unique_sessions=6),
+                material=MaterialInteraction(
+                    total_time_spent_seconds=5400, total_views=30, unique_materials_viewed=12
+                ),
+                activity=ActivityPattern(active_days=18, total_sessions=22, late_night_sessions=9),
+                quiz=QuizPerformance(quiz_attempts=4, avg_score=72.0, completion_rate=0.8),
+            ),
+        ]
+        results = classifier.predict_array(extractor.extract_batch(users))
+        
+        assert len(results) == len(users)
+        for result, data in zip(results, users):
+            single = classifier.predict(extractor.extract(data))
+            assert result.persona == single.persona
+            assert result.confidence == pytest.approx(single.confidence, abs=1e-6)
+    
+    def test_predict_array_accepts_prescaled_features(self, classifier: PersonaClassifier):
+        """Test that scaled=True skips the classifier's own scaling step."""
+        # A non-identity scaler, so scaling twice would change the input
+        scaler = MinMaxScaler().fit(
+            np.random.default_rng(1).random((50, len(FEATURE_NAMES))) * 0.5 + 0.2
+        )
+        classifier.scaler = scaler
+        extractor = FeatureExtractor()
+        extractor.scaler = scaler
+        users = [
+            BehaviorData(user_id="empty"),
+            BehaviorData(
+                user_id="active",
+                chat=ChatBehavior(total_messages=40, user_messages=25, unique_sessions=6),
+                activity=ActivityPattern(active_days=18, total_sessions=22, late_night_sessions=9),
+            ),
+        ]
+        
+        expected = classifier.predict_array(extractor.extract_batch(users))
+        prescaled = classifier.predict_array(
+            extractor.extract_and_scale_batch(users), scaled=True
+        )
+        
+        assert [r.persona for r in prescaled] == [r.persona for r in expected]
+        for result, reference in zip(prescaled, expected):
+            assert result.probabilities == pytest.approx(reference.probabilities)
+    
+    def test_predict_array_parallel_matches_serial(
+        self, classifier: PersonaClassifier, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that chunked thread-pool inference returns the same results."""
+        feature_array = np.random.default_rng(0).random((40, len(FeatureVector.model_fields)))
+        serial = classifier.predict_array(feature_array)
+        
+        monkeypatch.setattr(persona_classifier.os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(classifier, "PARALLEL_MIN_ROWS", 8)
+        parallel = classifier.predict_array(feature_array)
+        
+        assert parallel == serial
+    
+    def test_predict_array_on_inference_thread_runs_serially(
+        self, classifier: PersonaClassifier, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a batch on an inference pool worker is not split again."""
+        feature_array = np.random.default_rng(0).random((40, len(FeatureVector.model_fields)))
+        serial = classifier.predict_array(feature_array)
+        
+        monkeypatch.setattr(persona_classifier.os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(classifier, "PARALLEL_MIN_ROWS", 8)
+        
+        def fail():
+            raise AssertionError("nested split on an inference thread")
+        
+        monkeypatch.setattr(persona_classifier, "_get_executor", fail)
+        with ThreadPoolExecutor(
+            max_workers=1, initializer=persona_classifier.mark_inference_thread
+        ) as pool:
+            assert pool.submit(classifier.predict_array, feature_array).result() == serial
+    
+    def test_predict_array_rejects_wrong_shape(self, classifier: PersonaClassifier):
+        """Test that predict_array validates the feature column count."""
+        with pytest.raises(ValueError, match="shape"):
+            classifier.predict_array(np.zeros((2, 24)))
+    
+    def test_scale_matches_scaler_transform(self, classifier: PersonaClassifier):
+        """Test that the direct MinMaxScaler path equals transform()."""
+        if classifier.scaler is None:
+            pytest.skip("Scaler file not found")
+        
+        feature_array = np.random.default_rng(0).random((16, len(FeatureVector.model_fields)))
+        np.testing.assert_array_equal(
+            classifier._scale(feature_array), classifier.scaler.transform(feature_array)
+        )
+    
+    def test_predict_batch_empty(self, classifier: PersonaClassifier):
+        """Test that an empty batch returns no results."""
+        assert classifier.predict_batch([]) == []
+    
+    def test_predict_batch_raises_when_model_not_loaded(
+        self, sample_feature_vector: FeatureVector
+    ):
+        """Test that predict_batch raises RuntimeError when model is not loaded."""
+        classifier = PersonaClassifier()
+        with pytest.raises(RuntimeError, match="Model not loaded"):
+            classifier.predict_batch([sample_feature_vector])
 
 
 class TestLowConfidenceFlag:
@@ -316,6 +532,17 @@ class TestPredictProba:
         total = sum(result.values())
         assert pytest.approx(total, abs=0.01) == 1.0
     
+    def test_predict_compact_matches_predict(
+        self, classifier: PersonaClassifier, sample_feature_vector: FeatureVector
+    ):
+        """Test that the compact tuple carries the same prediction as predict."""
+        persona, confidence, probabilities = classifier.predict_compact(sample_feature_vector)
+        result = classifier.predict(sample_feature_vector)
+        
+        assert persona == result.persona
+        assert confidence == pytest.approx(result.confidence)
+        assert probabilities.tolist() == list(result.probabilities.values())
+    
     def test_predict_proba_raises_when_model_not_loaded(
         self, sample_feature_vector: FeatureVector
     ):
@@ -335,6 +562,80 @@ class TestPredictProba:
             assert prob == pytest.approx(predict_result.probabilities[persona])
 
 
+class TestPredictionCache:
+    """Tests for the opt-in predict() memoization."""
+    
+    @pytest.fixture
+    def features(self) -> FeatureVector:
+        return FeatureVector(**{name: 0.4 for name in FeatureVector.model_fields})
+    
+    def make_classifier(self, cache_size: int) -> PersonaClassifier:
+        if not MODEL_PATH.exists():
+            pytest.skip("Model file not found")
+        
+        return PersonaClassifier(
+            model_path=str(MODEL_PATH),
+            scaler_path=str(SCALER_PATH) if SCALER_PATH.exists() else None,
+            metadata_path=str(METADATA_PATH) if METADATA_PATH.exists() else None,
+            cache_size=cache_size,
+        )
+    
+    def test_only_memoizes_with_positive_cache_size(self, features: FeatureVector):
+        """Test that cache_size=0 stores nothing and clear_cache() empties it."""
+        uncached = self.make_classifier(cache_size=0)
+        uncached.predict(features)
+        assert len(uncached._cache) == 0
+        
+        cached = self.make_classifier(cache_size=8)
+        cached.predict(features)
+        assert len(cached._cache) == 1
+        cached.clear_cache()
+        assert len(cached._cache) == 0
+    
+    def test_hit_skips_the_model(self, features: FeatureVector, monkeypatch):
+        """Test that equal feature values are answered without predict_proba."""
+        classifier = self.make_classifier(cache_size=8)
+        expected = self.make_classifier(cache_size=0).predict(features)
+        
+        calls = []
+        predict_proba = classifier.model.predict_proba
+        
+        def counting_predict_proba(X):
+            calls.append(len(X))
+            return predict_proba(X)
+        
+        monkeypatch.setattr(classifier.model, "predict_proba", counting_predict_proba)
+        
+        first = classifier.predict(features)
+        second = classifier.predict(features.model_copy())
+        
+        assert first == second == expected
+        assert calls == [1]
+    
+    def test_hits_return_independent_copies(self, features: FeatureVector):
+        """Test that a caller mutating its result cannot corrupt later hits."""
+        classifier = self.make_classifier(cache_size=8)
+        classifier.predict(features).probabilities.clear()
+        
+        assert len(classifier.predict(features).probabilities) == 10
+    
+    def test_recently_read_entry_survives_eviction(self, features: FeatureVector):
+        """Test that re-reading an entry protects it from the next eviction."""
+        classifier = self.make_classifier(cache_size=2)
+        older, newer, newest = (
+            features.model_copy(update={"late_night_ratio": ratio}) for ratio in (0.1, 0.2, 0.3)
+        )
+        classifier.predict(older)
+        classifier.predict(newer)
+        
+        # Re-reading the older entry makes "newer" the least recently used
+        classifier.predict(older)
+        classifier.predict(newest)
+        
+        key = classifier._feature_vector_to_array
+        assert list(classifier._cache) == [key(older), key(newest)]
+
+
 class TestModelProperties:
     """Tests for model properties."""
     
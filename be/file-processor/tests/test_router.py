@@ -0,0 +1,277 @@
+"""
+Unit Tests for the Learning Pulse Router
+
+Tests the /predict-persona pipeline helpers in router.py.
+"""
+
+import asyncio
+
+import pytest
+from learning_pulse import router
+from learning_pulse.models import (
+    BehaviorData,
+    ChatBehavior,
+    MaterialInteraction,
+    ActivityPattern,
+    QuizPerformance,
+    FeatureSummary,
+    PredictRequest,
+    PredictResponse,
+)
+from learning_pulse.feature_extractor import FeatureExtractor
+
+
+@pytest.fixture(scope="module")
+def initialized_router():
+    """Initialize router components with the bundled model."""
+    assert router.initialize_components()
+    return router
+
+
+class RecordingClassifier:
+    """Stand-in classifier that records each predict_batch() call."""
+    
+    def __init__(self, error: Exception = None):
+        self.calls = []
+        self.error = error
+    
+    def predict_batch(self, features_list):
+        self.calls.append(list(features_list))
+        if self.error is not None:
+            raise self.error
+        return [f"result-{features}" for features in features_list]
+
+
+@pytest.fixture
+def predict_request() -> PredictRequest:
+    """Create a request that triggers guardrail flags."""
+    return PredictRequest(
+        user_id="user-1",
+        behavior_data=BehaviorData(
+            user_id="user-1",
+            chat=ChatBehavior(total_messages=40, user_messages=20, question_count=15),
+            material=MaterialInteraction(total_views=12, total_time_spent_seconds=3600),
+            activity=ActivityPattern(active_days=5, total_sessions=10, late_night_sessions=8),
+            quiz=QuizPerformance(quiz_attempts=3, avg_score=45.0, completion_rate=0.6),
+        ),
+        quiz_score=45.0,
+        previous_persona="master",
+    )
+
+
+def other_user(request: PredictRequest, user_id: str = "user-2") -> PredictRequest:
+    """Copy a request for another user, with the id changed in both places."""
+    return request.model_copy(update={
+        "user_id": user_id,
+        "behavior_data": request.behavior_data.model_copy(update={"user_id": user_id}),
+    })
+
+
+class TestUnvalidatedConstruction:
+    """Responses built with model_construct must match validated ones."""
+    
+    def test_feature_summary_matches_validated(self, predict_request):
+        """The summary is identical to one built with validation."""
+        features = FeatureExtractor().extract(predict_request.behavior_data)
+        summary = router._generate_feature_summary(features)
+        
+        validated = FeatureSummary.model_validate(summary.model_dump())
+        assert summary.model_dump() == validated.model_dump()
+        assert summary.model_dump_json() == validated.model_dump_json()
+    
+    async def test_predict_response_matches_validated(self, initialized_router, predict_request):
+        """The endpoint response is identical to one built with validation."""
+        router._response_cache.clear()
+        response = await initialized_router._predict(predict_request)
+        
+        validated = PredictResponse.model_validate(response.model_dump())
+        assert response.model_dump() == validated.model_dump()
+        assert response.model_dump_json() == validated.model_dump_json()
+
+
+class TestPredictionBatcher:
+    """Tests for coalescing concurrent classifications into batches."""
+    
+    async def test_concurrent_requests_share_one_batch(self):
+        """Concurrent classify() calls should run as one predict_batch call."""
+        classifier = RecordingClassifier()
+        batcher = router.PredictionBatcher(classifier, max_latency_ms=50)
+        
+        results = await asyncio.gather(*(batcher.classify(i) for i in range(5)))
+        
+        assert results == [f"result-{i}" for i in range(5)]
+        assert classifier.calls == [[0, 1, 2, 3, 4]]
+    
+    async def test_batches_are_capped_at_max_batch_size(self):
+        """A full batch should be dispatched without waiting for more."""
+        classifier = RecordingClassifier()
+        batcher = router.PredictionBatcher(classifier, max_batch_size=2, max_latency_ms=50)
+        
+        await asyncio.gather(*(batcher.classify(i) for i in range(3)))
+        
+        assert classifier.calls == [[0, 1], [2]]
+    
+    async def test_lone_request_is_dispatched_without_waiting(self):
+        """With a worker free, a single request should not wait out max_latency_ms."""
+        classifier = RecordingClassifier()
+        batcher = router.PredictionBatcher(classifier, max_latency_ms=5000)
+        
+        assert await asyncio.wait_for(batcher.classify(1), timeout=1) == "result-1"
+        assert classifier.calls == [[1]]
+    
+    async def test_batch_error_reaches_every_waiter(self):
+        """An exception from predict_batch should be raised to all requests."""
+        error = RuntimeError("inference failed")
+        batcher = router.PredictionBatcher(RecordingClassifier(error), max_latency_ms=50)
+        
+        results = await asyncio.gather(
+            *(batcher.classify(i) for i in range(3)), return_exceptions=True
+        )
+        
+        assert results == [error, error, error]
+    
+    async def test_cancelled_request_does_not_break_batch(self):
+        """Other requests in a batch should still get results after a cancel."""
+        classifier = RecordingClassifier()
+        batcher = router.PredictionBatcher(classifier, max_latency_ms=50)
+        
+        futures = [batcher.submit(i) for i in range(3)]
+        futures[1].cancel()
+        
+        assert await asyncio.gather(futures[0], futures[2]) == ["result-0", "result-2"]
+        assert classifier.calls == [[0, 1, 2]]
+        
+        # The batcher keeps serving later requests
+        assert await batcher.classify(3) == "result-3"
+    
+    def test_restarts_on_new_event_loop(self):
+        """The background task should be recreated for a new event loop."""
+        batcher = router.PredictionBatcher(RecordingClassifier(), max_latency_ms=1)
+        
+        assert asyncio.run(batcher.classify(1)) == "result-1"
+        first_task = batcher._task
+        
+        assert asyncio.run(batcher.classify(2)) == "result-2"
+        assert batcher._task is not first_task
+
+
+class TestResponseCache:
+    """Tests for the /predict-persona response cache."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch) -> list:
+        """Patch time.monotonic with a settable clock, starting at 100s."""
+        now = [100.0]
+        monkeypatch.setattr(router.time, "monotonic", lambda: now[0])
+        return now
+    
+    @staticmethod
+    def make_response(user_id: str) -> PredictResponse:
+        """Build a small response whose lists can be mutated."""
+        return PredictResponse(
+            user_id=user_id,
+            persona="lost",
+            confidence=0.6,
+            is_low_confidence=False,
+            recommendations=[],
+            feature_summary=FeatureSummary(
+                chat_engagement="low",
+                material_consumption="low",
+                activity_consistency="low",
+                key_indicators=["Sporadic activity pattern"],
+            ),
+            flags=["flag"],
+            processing_time_ms=1.0,
+        )
+    
+    def test_entries_expire_after_ttl(self, clock):
+        """An entry is served until its TTL passes, then dropped."""
+        cache = router.ResponseCache(maxsize=4, ttl=10)
+        cache.put(b"key", self.make_response("user-1"))
+        
+        clock[0] = 109.9
+        assert cache.get(b"key").user_id == "user-1"
+        
+        clock[0] = 110.0
+        assert cache.get(b"key") is None
+        assert b"key" not in cache._entries
+    
+    def test_evicts_least_recently_used(self, clock):
+        """A re-read entry survives; the least recently used one is evicted."""
+        cache = router.ResponseCache(maxsize=2, ttl=10)
+        cache.put(b"older", self.make_response("older"))
+        cache.put(b"newer", self.make_response("newer"))
+        
+        # Touch the older entry, making "newer" the least recently used
+        assert cache.get(b"older").user_id == "older"
+        cache.put(b"newest", self.make_response("newest"))
+        
+        assert cache.get(b"newer") is None
+        assert cache.get(b"older").user_id == "older"
+        assert cache.get(b"newest").user_id == "newest"
+    
+    def test_mutating_responses_does_not_alter_cache(self, clock):
+        """Lists of stored and returned responses are not shared with the cache."""
+        cache = router.ResponseCache(maxsize=4, ttl=10)
+        stored = self.make_response("user-1")
+        cache.put(b"key", stored)
+        stored.flags.append("stored-leak")
+        
+        hit = cache.get(b"key")
+        hit.flags.append("hit-leak")
+        hit.recommendations.append("hit-leak")
+        hit.feature_summary.key_indicators.append("hit-leak")
+        
+        again = cache.get(b"key")
+        assert again.flags == ["flag"]
+        assert again.recommendations == []
+        assert again.feature_summary.key_indicators == ["Sporadic activity pattern"]
+    
+    def test_key_depends_on_quiz_score_and_previous_persona(self, predict_request):
+        """Inputs that change the prediction must change the key."""
+        key = router.ResponseCache.key_for(predict_request)
+        
+        assert key != router.ResponseCache.key_for(
+            predict_request.model_copy(update={"quiz_score": 90.0})
+        )
+        assert key != router.ResponseCache.key_for(
+            predict_request.model_copy(update={"previous_persona": None})
+        )
+        assert key != router.ResponseCache.key_for(
+            predict_request.model_copy(update={"previous_persona": "anxious"})
+        )
+    
+    def test_key_ignores_user_ids(self, predict_request):
+        """Users with identical behavior share a key, as clients send both ids."""
+        assert router.ResponseCache.key_for(predict_request) == router.ResponseCache.key_for(
+            other_user(predict_request)
+        )
+    
+    async def test_hit_rewrites_user_id_and_processing_time(
+        self, initialized_router, predict_request
+    ):
+        """A cached response is returned for the new user with fresh timing."""
+        router._response_cache.clear()
+        first = await initialized_router._predict(predict_request)
+        
+        key = router.ResponseCache.key_for(predict_request)
+        cached = router._response_cache.get(key)
+        assert cached is not None
+        
+        # Make the hit distinguishable from the stored timing
+        router._response_cache.put(
+            key, cached.model_copy(update={"processing_time_ms": 1_000_000.0})
+        )
+        second = await initialized_router._predict(other_user(predict_request))
+        
+        assert second.user_id == "user-2"
+        assert second.processing_time_ms < 1_000_000.0
+        assert second.model_dump(exclude={"user_id", "processing_time_ms"}) == first.model_dump(
+            exclude={"user_id", "processing_time_ms"}
+        )
+        
+        # The stored entry itself is not rewritten
+        stored = router._response_cache.get(key)
+        assert stored.user_id == "user-1"
+        assert stored.processing_time_ms == 1_000_000.0
+        router._response_cache.clear()